@@ -117,21 +117,20 @@ def download_papers_command(args) -> None:
         results = repo.search_papers(query=args.query, limit=args.limit)
         print(f"Found {len(results)} papers, starting download...")
         
-        downloaded_count = 0
         format_list = [f.strip() for f in args.formats.split(',')]
-        
+        paper_ids = []
         for paper in results:
             paper_id = paper.get('pmcid') or paper.get('arxiv_id') or paper.get('pmid')
-            if not paper_id:
-                continue
-            
-            try:
-                result = repo.download_paper(paper_id, output_dir, format_list)
-                if result['success']:
-                    downloaded_count += 1
-                    print(f"Downloaded {paper_id}")
-            except Exception as e:
-                print(f"Failed to download {paper_id}: {e}")
+            if paper_id:
+                paper_ids.append(paper_id)
+        
+        downloaded_count = 0
+        for paper_id, result in repo.download_papers(paper_ids, output_dir, format_list).items():
+            if result['success']:
+                downloaded_count += 1
+                print(f"Downloaded {paper_id}")
+            else:
+                print(f"Failed to download {paper_id}: {result['error']}")
         
         print(f"Downloaded {downloaded_count} papers to {output_dir}")
         
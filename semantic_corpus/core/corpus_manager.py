@@ -1,29 +1,52 @@
 """Core corpus management functionality."""
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from semantic_corpus.core.exceptions import CorpusError
 
+BACKENDS = ("fs", "memory")
+
 
 class CorpusManager:
     """Manages scientific paper corpora."""
 
-    def __init__(self, corpus_dir: Path, use_bagit: bool = False) -> None:
+    def __init__(self, corpus_dir: Path, use_bagit: bool = False, backend: str = "fs") -> None:
         """Initialize corpus manager with a directory.
         
         Args:
             corpus_dir: Path to the corpus directory
             use_bagit: If True, create a BAGIT-compliant bag structure
+            backend: "fs" to store papers under corpus_dir, or "memory" to keep
+                paper metadata in RAM only (nothing is written to disk)
             
         Raises:
-            CorpusError: If the directory cannot be created or accessed
+            CorpusError: If the directory cannot be created or accessed,
+                or the backend is unknown or incompatible with BAGIT
         """
         self.corpus_dir = Path(corpus_dir)
         self.use_bagit = use_bagit
         
+        if backend not in BACKENDS:
+            raise CorpusError(f"Unknown corpus backend '{backend}'. Available backends: {', '.join(BACKENDS)}")
+        if backend == "memory" and use_bagit:
+            raise CorpusError("BAGIT support requires the 'fs' backend")
+        self.backend = backend
+        # Serializes BAGIT manifest rewrites when papers are added from several threads
+        self._lock = threading.Lock()
+        # Serialized metadata JSON per paper ID, used by the memory backend
+        self._papers: Dict[str, str] = {}
+        # Lowercased search text per field and paper ID (None if the paper
+        # lacks the field); filled by search_papers, dropped on every write
+        self._search_cache: Dict[str, Dict[str, Optional[str]]] = {}
+        
+        if self.backend == "memory":
+            self.bagit_manager = None
+            return
+        
         # Validate parent directory exists for invalid paths
         if not self.corpus_dir.parent.exists():
             raise CorpusError(f"Parent directory does not exist: {self.corpus_dir.parent}")
@@ -55,9 +78,36 @@ class CorpusManager:
         if self.bagit_manager:
             self.bagit_manager.create_structured_directories()
 
+    def _metadata_file(self, paper_id: str) -> Path:
+        """Return the metadata file path for a paper, creating its directory."""
+        if self.use_bagit:
+            # Use BAGIT structure: data/metadata/{paper_id}_metadata.json
+            metadata_dir = Path(self.corpus_dir, "data", "metadata")
+            metadata_dir.mkdir(parents=True, exist_ok=True)
+            return metadata_dir / f"{paper_id}_metadata.json"
+        # Use old structure: papers/{paper_id}/metadata.json
+        paper_dir = Path(self.corpus_dir, "papers", paper_id)
+        paper_dir.mkdir(parents=True, exist_ok=True)
+        return Path(paper_dir, "metadata.json")
+
+    def _write_metadata(self, paper_id: str, metadata: Dict[str, Any]) -> None:
+        """Write a paper's metadata file without touching the BAGIT manifest."""
+        if self.backend == "memory":
+            self._papers[paper_id] = json.dumps(metadata, indent=2, ensure_ascii=False)
+        else:
+            metadata_file = self._metadata_file(paper_id)
+            with open(metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False)
+        
+        for field_values in self._search_cache.values():
+            field_values.pop(paper_id, None)
+
     def add_paper(self, paper_id: str, metadata: Dict[str, Any]) -> bool:
         """Add a paper to the corpus.
         
+        Safe to call from several threads; only the BAGIT manifest update
+        is serialized.
+        
         Args:
             paper_id: Unique identifier for the paper
             metadata: Paper metadata dictionary
@@ -69,30 +119,47 @@ class CorpusManager:
             CorpusError: If paper cannot be added
         """
         try:
-            if self.use_bagit:
-                # Use BAGIT structure: data/metadata/{paper_id}_metadata.json
-                metadata_dir = Path(self.corpus_dir, "data", "metadata")
-                metadata_dir.mkdir(parents=True, exist_ok=True)
-                metadata_file = metadata_dir / f"{paper_id}_metadata.json"
-            else:
-                # Use old structure: papers/{paper_id}/metadata.json
-                paper_dir = Path(self.corpus_dir, "papers", paper_id)
-                paper_dir.mkdir(parents=True, exist_ok=True)
-                metadata_file = Path(paper_dir, "metadata.json")
-            
-            # Save metadata
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self._write_metadata(paper_id, metadata)
             
             # Update BAGIT manifest if using BAGIT
             if self.use_bagit and self.bagit_manager:
-                self.bagit_manager.update_manifest()
+                with self._lock:
+                    self.bagit_manager.update_manifest()
             
             return True
             
-        except (OSError, json.JSONEncodeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             raise CorpusError(f"Cannot add paper {paper_id}: {e}")
 
+    def add_papers_bulk(self, papers: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Add several papers to the corpus in one batch.
+        
+        Metadata files are written one after another and the BAGIT manifest
+        (if any) is rebuilt once at the end instead of once per paper.
+        
+        Args:
+            papers: Mapping of paper ID to paper metadata dictionary
+            
+        Returns:
+            List of paper IDs that were added, in input order
+            
+        Raises:
+            CorpusError: If any paper cannot be added
+        """
+        added = []
+        for paper_id, metadata in papers.items():
+            try:
+                self._write_metadata(paper_id, metadata)
+            except (OSError, TypeError, ValueError) as e:
+                raise CorpusError(f"Cannot add paper {paper_id}: {e}")
+            added.append(paper_id)
+        
+        if added and self.use_bagit and self.bagit_manager:
+            with self._lock:
+                self.bagit_manager.update_manifest()
+        
+        return added
+
     def get_paper_metadata(self, paper_id: str) -> Dict[str, Any]:
         """Get metadata for a paper.
         
@@ -105,6 +172,11 @@ class CorpusManager:
         Raises:
             CorpusError: If paper not found or metadata cannot be read
         """
+        if self.backend == "memory":
+            if paper_id not in self._papers:
+                raise CorpusError(f"Paper {paper_id} not found")
+            return json.loads(self._papers[paper_id])
+        
         if self.use_bagit:
             # Try BAGIT structure first
             metadata_file = Path(self.corpus_dir, "data", "metadata", f"{paper_id}_metadata.json")
@@ -128,6 +200,9 @@ class CorpusManager:
         Returns:
             List of paper IDs
         """
+        if self.backend == "memory":
+            return list(self._papers)
+        
         if self.use_bagit:
             # List from BAGIT structure: data/metadata/{paper_id}_metadata.json
             metadata_dir = Path(self.corpus_dir, "data", "metadata")
@@ -151,6 +226,11 @@ class CorpusManager:
     def search_papers(self, query: str, field: str = "title") -> List[str]:
         """Search papers in the corpus.
         
+        Matching is a case-insensitive substring test. Each paper's
+        lowercased field value is cached after the first search, so repeated
+        searches only read metadata for papers written since then. Files
+        changed outside this CorpusManager are not noticed.
+        
         Args:
             query: Search query string
             field: Field to search in (default: "title")
@@ -158,19 +238,23 @@ class CorpusManager:
         Returns:
             List of paper IDs matching the query
         """
+        query = query.lower()
+        field_values = self._search_cache.setdefault(field, {})
         results = []
-        papers = self.list_papers()
         
-        for paper_id in papers:
-            try:
-                metadata = self.get_paper_metadata(paper_id)
-                if field in metadata:
-                    field_value = str(metadata[field]).lower()
-                    if query.lower() in field_value:
-                        results.append(paper_id)
-            except CorpusError:
-                # Skip papers with errors
-                continue
+        for paper_id in self.list_papers():
+            if paper_id not in field_values:
+                # First search of this field since the paper was written
+                try:
+                    metadata = self.get_paper_metadata(paper_id)
+                except CorpusError:
+                    # Skip papers with errors
+                    continue
+                field_values[paper_id] = str(metadata[field]).lower() if field in metadata else None
+            
+            field_value = field_values[paper_id]
+            if field_value is not None and query in field_value:
+                results.append(paper_id)
         
         return results
 
@@ -184,12 +268,15 @@ class CorpusManager:
         
         # Calculate corpus size
         corpus_size_bytes = 0
-        for paper_id in papers:
-            paper_dir = Path(self.corpus_dir, "papers", paper_id)
-            if paper_dir.exists():
-                for file_path in paper_dir.rglob("*"):
-                    if file_path.is_file():
-                        corpus_size_bytes += file_path.stat().st_size
+        if self.backend == "memory":
+            corpus_size_bytes = sum(len(text.encode('utf-8')) for text in self._papers.values())
+        else:
+            for paper_id in papers:
+                paper_dir = Path(self.corpus_dir, "papers", paper_id)
+                if paper_dir.exists():
+                    for file_path in paper_dir.rglob("*"):
+                        if file_path.is_file():
+                            corpus_size_bytes += file_path.stat().st_size
         
         corpus_size_mb = corpus_size_bytes / (1024 * 1024)
         
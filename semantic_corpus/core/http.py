@@ -0,0 +1,113 @@
+"""HTTP session helpers shared by repository implementations."""
+
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Downloads are written in chunks of this size, so memory use does not grow
+# with the size of the file
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Connect/read timeout in seconds for streamed downloads, so a stalled
+# server cannot hold a download worker forever
+DOWNLOAD_TIMEOUT = 60
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = 8,
+    pool_maxsize: int = 16,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Tuple[int, ...] = (500, 502, 504),
+) -> requests.Session:
+    """Create a requests session backed by a keep-alive connection pool.
+    
+    Reusing one session keeps TCP/TLS connections open between calls to the
+    same host instead of opening a new connection per request. Failed
+    connections and transient server errors are retried with exponential
+    backoff; throttling (429/503) is left to repositories whose limits need
+    their own pacing, such as arXiv. requests already asks
+    for gzip/deflate-encoded responses and decodes them transparently.
+    
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept open per host
+        max_retries: Number of retries for failed connections
+        backoff_factor: Base delay in seconds for the retry backoff
+        status_forcelist: HTTP statuses that are retried; once retries run
+            out the last response is returned for raise_for_status()
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session shared by all repositories.
+    
+    Repositories talking to different hosts still share one pool manager,
+    so a connection opened by one instance is reused by every other.
+    
+    Returns:
+        Shared requests session, created on first use
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
+
+
+def close_session() -> None:
+    """Close the shared session; the next get_session() call opens a new one."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
+
+def write_response(response: requests.Response, path: Path) -> None:
+    """Stream the body of a response opened with stream=True to a file.
+    
+    The body is decoded (gzip/deflate) and written chunk by chunk rather
+    than loaded whole through response.content. A partly written file is
+    removed if the transfer fails.
+    
+    Args:
+        response: Response from a request made with stream=True
+        path: File to write
+        
+    Raises:
+        requests.RequestException: If the connection fails mid-transfer
+    """
+    try:
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+    except BaseException:
+        Path(path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,113 @@
+"""Disk cache for repository metadata responses."""
+
+import re
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Mapping, NamedTuple, Optional
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body with the validators needed to revalidate it."""
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be used without asking the server."""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a refetch into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MetadataCache:
+    """SQLite-backed cache of metadata responses keyed by repository and paper.
+
+    Entries stay fresh for the server's Cache-Control max-age, or
+    expire_after seconds when none is given. Stale entries keep their ETag
+    and Last-Modified values so a refetch can be answered with
+    304 Not Modified. Each operation opens its own connection, so one cache
+    can be shared by threads.
+    """
+
+    def __init__(self, path: Path, expire_after: float = 86400) -> None:
+        """Initialize metadata cache.
+
+        Args:
+            path: SQLite database file, created if missing
+            expire_after: Default freshness lifetime in seconds
+        """
+        self.path = Path(path)
+        self.expire_after = expire_after
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for key, fresh or stale, if any."""
+        with closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def contains(self, key: str) -> bool:
+        """Return True if a response is cached for key."""
+        return self.get(key) is not None
+
+    def store(self, key: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """Cache a response body together with its validators.
+
+        Args:
+            key: Cache key, e.g. "europe_pmc:PMC123"
+            body: Raw response body
+            headers: Response headers (ETag, Last-Modified, Cache-Control)
+        """
+        cache_control = headers.get("Cache-Control", "")
+        if "no-store" in cache_control:
+            return
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    body,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    self._expires_at(cache_control),
+                ),
+            )
+
+    def refresh(self, key: str, headers: Mapping[str, str]) -> None:
+        """Extend a stale entry after the server answered 304 Not Modified."""
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?",
+                (self._expires_at(headers.get("Cache-Control", "")), key),
+            )
+
+    def _expires_at(self, cache_control: str) -> float:
+        """Expiry timestamp from Cache-Control, falling back to expire_after."""
+        if "no-cache" in cache_control:
+            return 0.0
+        match = _MAX_AGE_RE.search(cache_control)
+        max_age = int(match.group(1)) if match else self.expire_after
+        return time.time() + max_age
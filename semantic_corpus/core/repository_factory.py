@@ -1,10 +1,10 @@
 """Factory for creating repository instances."""
 
-from typing import Dict, List, Type
+import functools
+import importlib
+from typing import Dict, List, Type, Union
 from semantic_corpus.core.repository_interface import RepositoryInterface
 from semantic_corpus.core.exceptions import RepositoryError
-from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
-from semantic_corpus.repositories.arxiv import ArxivRepository
 
 
 class RepositoryFactory:
@@ -12,15 +12,33 @@ class RepositoryFactory:
     A repository is a foreign source of papers  such as Europe PMC or arXiv.
     """
 
-    _repositories: Dict[str, Type[RepositoryInterface]] = {
-        "europe_pmc": EuropePMCRepository,
-        "arxiv": ArxivRepository,
+    # Built-in repositories are named as "module:Class" and imported on first
+    # use, so importing the factory does not pull in the HTTP client stack
+    _repositories: Dict[str, Union[str, Type[RepositoryInterface]]] = {
+        "europe_pmc": "semantic_corpus.repositories.europe_pmc:EuropePMCRepository",
+        "arxiv": "semantic_corpus.repositories.arxiv:ArxivRepository",
     }
 
     @classmethod
+    def _resolve(cls, name: str) -> Type[RepositoryInterface]:
+        """Return the repository class for name, importing it if still lazy."""
+        entry = cls._repositories[name]
+        if isinstance(entry, str):
+            module_name, class_name = entry.split(":")
+            entry = getattr(importlib.import_module(module_name), class_name)
+            cls._repositories[name] = entry
+        return entry
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_repository(cls, name: str) -> RepositoryInterface:
         """Get a repository instance by name.
         
+        Instances are cached, so repeated lookups of the same name return the
+        same repository object and reuse its HTTP connection pool. Callers
+        therefore share the instance and must not mutate it; the built-in
+        repositories are safe to use from several threads.
+        
         Args:
             name: Repository name
             
@@ -36,7 +54,7 @@ class RepositoryFactory:
                 f"Repository '{name}' not found. Available repositories: {available}"
             )
         
-        return cls._repositories[name]()
+        return cls._resolve(name)()
 
     @classmethod
     def list_repositories(cls) -> List[str]:
@@ -56,3 +74,4 @@ class RepositoryFactory:
             repository_class: Repository class to register
         """
         cls._repositories[name] = repository_class
+        cls.get_repository.cache_clear()
@@ -1,6 +1,7 @@
 """Repository interface for different paper sources."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -14,6 +15,9 @@ class RepositoryInterface(ABC):
         """Initialize repository interface."""
         self.name: str = ""
         self.base_url: str = ""
+        # Concurrent downloads used by download_papers(); sources with strict
+        # rate limits lower this
+        self.max_download_workers: int = 8
 
     @abstractmethod
     def search_papers(
@@ -78,6 +82,43 @@ class RepositoryInterface(ABC):
         """
         pass
 
+    def download_papers(
+        self,
+        paper_ids: List[str],
+        output_dir: Path,
+        formats: List[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Download several papers concurrently.
+        
+        Each paper is fetched with download_paper() on a thread pool, so the
+        network round-trips overlap. A failed paper does not stop the others:
+        whatever it raises, its result has success False and the error
+        message. Repeated IDs are downloaded once.
+        
+        Args:
+            paper_ids: Unique identifiers of the papers to download
+            output_dir: Directory to save downloaded files
+            formats: List of formats to download (e.g., ['xml', 'pdf'])
+            max_workers: Maximum concurrent downloads (default: max_download_workers)
+            
+        Returns:
+            Dictionary mapping each paper ID to its download result, in order
+            of first appearance
+        """
+        def download_one(paper_id: str) -> Dict[str, Any]:
+            try:
+                return self.download_paper(paper_id, output_dir, formats)
+            except Exception as e:
+                return {"success": False, "paper_id": paper_id, "error": str(e)}
+        
+        unique_ids = list(dict.fromkeys(paper_ids))
+        if not unique_ids:
+            return {}
+        workers = max_workers or self.max_download_workers
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(download_one, unique_ids)))
+
     @abstractmethod
     def get_repository_info(self) -> Dict[str, Any]:
         """Get information about the repository.
@@ -16,6 +16,7 @@ from semantic_corpus.ingestion.pygetpapers_ingester import (
     _eupmc_json_to_raw_metadata,
 )
 from semantic_corpus.tools.metadata_processor import MetadataProcessor
+from semantic_corpus.utils import read_json_file
 
 
 def _paper_has_file(corpus_dir: Path, paper_id: str, ext: str) -> bool:
@@ -73,8 +74,7 @@ def build_review_rows_from_pygetpapers(
 
     for folder in _discover_paper_folders(pygetpapers_dir):
         json_path = Path(folder, "eupmc_result.json")
-        with open(json_path, "r", encoding="utf-8") as handle:
-            eupmc_data = json.load(handle)
+        eupmc_data = read_json_file(json_path)
         raw = _eupmc_json_to_raw_metadata(eupmc_data)
         metadata = processor.normalize_metadata(raw)
         paper_id = f"europe_pmc_{folder.name}"
@@ -152,8 +152,7 @@ def build_review_rows_from_search_results(
         xml_dir = search_results_path.parent
     xml_dir = Path(xml_dir)
 
-    with open(search_results_path, "r", encoding="utf-8") as handle:
-        results = json.load(handle)
+    results = read_json_file(search_results_path)
     if not isinstance(results, list):
         raise CorpusError(
             f"search_results.json must contain a list, got {type(results).__name__}"
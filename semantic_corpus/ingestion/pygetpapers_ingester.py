@@ -1,13 +1,19 @@
 """Ingest classic pygetpapers output directories into a semantic_corpus."""
 
-import json
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
 from semantic_corpus.core.corpus_manager import CorpusManager
 from semantic_corpus.core.exceptions import CorpusError
 from semantic_corpus.tools.metadata_processor import MetadataProcessor
+from semantic_corpus.utils import intern_short, read_json_file
+
+# Separator between names in authorString, absorbing any trailing initials' dot
+_AUTHOR_SPLIT_RE = re.compile(r"[\s.]*,\s*")
 
 
 def _eupmc_json_to_raw_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -19,19 +25,20 @@ def _eupmc_json_to_raw_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
     raw["pmcid"] = data.get("pmcid") or ""
     raw["pmid"] = data.get("pmid") or ""
     author_string = data.get("authorString") or ""
+    # "Author A, Author B." -> ["Author A", "Author B"] in one regex pass
     raw["authors"] = [
-        a.strip().rstrip(".").strip()
-        for a in author_string.split(",")
-        if a.strip()
+        intern_short(a)
+        for a in _AUTHOR_SPLIT_RE.split(author_string.strip().rstrip(". \t\r\n"))
+        if a
     ]
-    raw["publication_date"] = (
+    raw["publication_date"] = intern_short(
         data.get("firstPublicationDate")
         or data.get("dateOfCreation")
         or (str(data.get("pubYear", "")) if data.get("pubYear") else "")
     )
     journal_info = data.get("journalInfo") or {}
     journal = journal_info.get("journal") if isinstance(journal_info.get("journal"), dict) else None
-    raw["journal"] = journal.get("title", "") if journal else ""
+    raw["journal"] = intern_short(journal.get("title", "") if journal else "")
     return raw
 
 
@@ -40,14 +47,63 @@ def _discover_paper_folders(pygetpapers_dir: Path) -> List[Path]:
     if not pygetpapers_dir.is_dir():
         return []
     folders: List[Path] = []
-    for child in pygetpapers_dir.iterdir():
-        if child.is_dir() and child.name.startswith("PMC"):
-            # Must have at least eupmc_result.json to be a paper folder
-            if (child / "eupmc_result.json").exists():
-                folders.append(child)
+    # scandir's DirEntry reuses the file type from the directory listing,
+    # so only PMC* directories cost a further stat
+    with os.scandir(pygetpapers_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("PMC") and entry.is_dir():
+                # Must have at least eupmc_result.json to be a paper folder
+                if os.path.exists(os.path.join(entry.path, "eupmc_result.json")):
+                    folders.append(Path(entry.path))
     return sorted(folders)
 
 
+def _ingest_paper_folder(
+    paper_folder: Path,
+    corpus_id: str,
+    corpus_dir: Path,
+    processor: MetadataProcessor,
+) -> Dict[str, Any]:
+    """Read one PMC folder's metadata and copy its full texts into the corpus.
+
+    Returns:
+        Normalized metadata for the paper.
+
+    Raises:
+        CorpusError: If eupmc_result.json cannot be read or a full text
+            cannot be copied; copies already made for the paper are removed.
+    """
+    json_path = paper_folder / "eupmc_result.json"
+    try:
+        eupmc_data = read_json_file(json_path)
+    except (OSError, ValueError) as e:
+        raise CorpusError(f"Cannot read {json_path}: {e}") from e
+
+    # Everything that can reject the paper runs before any file is copied
+    raw = _eupmc_json_to_raw_metadata(eupmc_data)
+    normalized = processor.normalize_metadata(raw)
+
+    # fulltext.xml goes to data/documents/xml/, fulltext.pdf (if present) to
+    # data/documents/pdf/. If a copy fails, the ones already made are removed
+    # so no payload file is left without metadata.
+    copied: List[Path] = []
+    try:
+        for name, format_type in (("fulltext.xml", "xml"), ("fulltext.pdf", "pdf")):
+            src = paper_folder / name
+            if not src.exists():
+                continue
+            dst = Path(corpus_dir, "data", "documents", format_type, f"{corpus_id}.{format_type}")
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            copied.append(dst)
+            shutil.copyfile(src, dst)
+    except OSError as e:
+        for dst in copied:
+            dst.unlink(missing_ok=True)
+        raise CorpusError(f"Cannot copy full text for {paper_folder.name}: {e}") from e
+
+    return normalized
+
+
 def ingest_pygetpapers_directory(
     pygetpapers_dir: Path,
     corpus: CorpusManager,
@@ -68,7 +124,8 @@ def ingest_pygetpapers_directory(
         List of corpus paper IDs that were added.
 
     Raises:
-        CorpusError: If the directory is invalid or ingestion fails.
+        CorpusError: If the directory is invalid, or if any paper folder
+            fails; the other folders are still added to the corpus first.
     """
     pygetpapers_dir = Path(pygetpapers_dir)
     if not pygetpapers_dir.exists():
@@ -80,52 +137,30 @@ def ingest_pygetpapers_directory(
         raise CorpusError("Pygetpapers ingestion requires a BAGIT corpus (use_bagit=True)")
 
     processor = MetadataProcessor()
-    added: List[str] = []
-
-    for paper_folder in _discover_paper_folders(pygetpapers_dir):
-        pmcid = paper_folder.name
-        corpus_id = f"{paper_id_prefix}{pmcid}"
-
-        json_path = paper_folder / "eupmc_result.json"
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                eupmc_data = json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
-            raise CorpusError(f"Cannot read {json_path}: {e}") from e
-
-        raw = _eupmc_json_to_raw_metadata(eupmc_data)
-        normalized = processor.normalize_metadata(raw)
-        corpus.add_paper(corpus_id, normalized)
-
-        # Copy fulltext.xml to data/documents/xml/
-        xml_src = paper_folder / "fulltext.xml"
-        if xml_src.exists():
-            xml_dst = Path(
-                corpus.corpus_dir,
-                "data",
-                "documents",
-                "xml",
-                f"{corpus_id}.xml",
-            )
-            xml_dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(xml_src, xml_dst)
-
-        # Copy fulltext.pdf to data/documents/pdf/ if present
-        pdf_src = paper_folder / "fulltext.pdf"
-        if pdf_src.exists():
-            pdf_dst = Path(
-                corpus.corpus_dir,
-                "data",
-                "documents",
-                "pdf",
-                f"{corpus_id}.pdf",
-            )
-            pdf_dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(pdf_src, pdf_dst)
-
-        if corpus.bagit_manager:
-            corpus.bagit_manager.update_manifest()
-
-        added.append(corpus_id)
-
+    folders = _discover_paper_folders(pygetpapers_dir)
+    corpus_ids = [f"{paper_id_prefix}{folder.name}" for folder in folders]
+
+    # Folders are independent, so JSON parsing and file copies overlap across
+    # threads. Each folder's outcome is collected separately, so one bad
+    # folder does not stop the others from being ingested.
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(_ingest_paper_folder, folder, corpus_id, corpus.corpus_dir, processor)
+            for folder, corpus_id in zip(folders, corpus_ids)
+        ]
+        papers: Dict[str, Dict[str, Any]] = {}
+        errors: List[str] = []
+        for folder, corpus_id, future in zip(folders, corpus_ids, futures):
+            try:
+                papers[corpus_id] = future.result()
+            except Exception as e:
+                errors.append(f"{folder.name}: {e}")
+
+    # Metadata writes and the single BAGIT manifest update happen together
+    added = corpus.add_papers_bulk(papers)
+    if errors:
+        raise CorpusError(
+            f"Failed to ingest {len(errors)} of {len(folders)} paper folders "
+            f"({len(added)} added): " + "; ".join(errors)
+        )
     return added
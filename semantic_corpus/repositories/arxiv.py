@@ -1,44 +1,216 @@
 """arXiv repository implementation."""
 
+import io
 import json
+import random
+import re
 import requests
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from lxml import etree
+
+from semantic_corpus.core.http import DOWNLOAD_TIMEOUT, get_session, write_response
 from semantic_corpus.core.repository_interface import RepositoryInterface
 from semantic_corpus.core.exceptions import RepositoryError
 
 
+_NAMESPACES = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+# Compiled once at import and reused for every feed; smart_strings=False
+# returns plain str results that do not keep the parsed tree alive
+_ID_XP = etree.XPath(
+    "string(atom:id)", namespaces=_NAMESPACES, smart_strings=False
+)
+_TITLE_XP = etree.XPath(
+    "string(atom:title)", namespaces=_NAMESPACES, smart_strings=False
+)
+_SUMMARY_XP = etree.XPath(
+    "string(atom:summary)", namespaces=_NAMESPACES, smart_strings=False
+)
+_AUTHOR_NAMES_XP = etree.XPath(
+    "atom:author/atom:name/text()", namespaces=_NAMESPACES, smart_strings=False
+)
+_PUBLISHED_XP = etree.XPath(
+    "string(atom:published)", namespaces=_NAMESPACES, smart_strings=False
+)
+_CATEGORIES_XP = etree.XPath(
+    "arxiv:primary_category/@term", namespaces=_NAMESPACES, smart_strings=False
+)
+
+# arXiv accepts up to this many comma-separated IDs in one id_list query
+_ID_LIST_BATCH_SIZE = 200
+
+_VERSION_RE = re.compile(r"v\d+$")
+
+_ENTRY_TAG = f"{{{_NAMESPACES['atom']}}}entry"
+_ERROR_TAG = f"{{{_NAMESPACES['atom']}}}error"
+
+# arXiv's rate limit applies per client, so request spacing is shared by
+# every ArxivRepository instance and thread in the process
+_RATE_LOCK = threading.Lock()
+_next_request_at = 0.0
+
+# Statuses arXiv returns when it wants clients to slow down
+_RETRY_STATUSES = frozenset({429, 503})
+
+
+def _parse_entry(entry: etree._Element) -> Dict[str, Any]:
+    """Convert one Atom <entry> from an arXiv feed to a metadata dictionary."""
+    return {
+        "arxiv_id": _ID_XP(entry).split("/")[-1],  # Extract ID from URL
+        "title": _TITLE_XP(entry),
+        "abstract": _SUMMARY_XP(entry),
+        "authors": [{"name": name} for name in _AUTHOR_NAMES_XP(entry)],
+        "publication_date": _PUBLISHED_XP(entry),
+        "categories": _CATEGORIES_XP(entry),
+    }
+
+
+def _bare_id(arxiv_id: str) -> str:
+    """Strip the archive prefix and version from an arXiv ID for matching."""
+    return _VERSION_RE.sub("", arxiv_id.rsplit("/", 1)[-1])
+
+
+def _parse_feed(content: bytes, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Stream the entries of an arXiv Atom feed into metadata dictionaries.
+    
+    Entries are converted as soon as each one is parsed and then freed, so
+    memory stays flat however many results a feed holds. Parsing stops once
+    limit entries have been read.
+    
+    Args:
+        content: Raw feed bytes
+        limit: Maximum number of entries to return
+        
+    Returns:
+        List of metadata dictionaries, in feed order
+        
+    Raises:
+        RepositoryError: If the feed reports an error. arXiv signals problems
+            such as malformed IDs with a single entry whose id points at
+            http://arxiv.org/api/errors and whose summary holds the message.
+        etree.XMLSyntaxError: If the feed is not well-formed XML
+    """
+    results: List[Dict[str, Any]] = []
+    if limit is not None and limit <= 0:
+        return results
+    # Feeds come from the network, so never expand entities
+    events = etree.iterparse(
+        io.BytesIO(content),
+        events=("end",),
+        tag=(_ENTRY_TAG, _ERROR_TAG),
+        resolve_entities=False,
+        no_network=True,
+        collect_ids=False,
+    )
+    for _, elem in events:
+        if elem.tag == _ERROR_TAG:
+            raise RepositoryError(f"arXiv API error: {elem.text}")
+        if not results and "/api/errors" in _ID_XP(elem):
+            raise RepositoryError(f"arXiv API error: {_SUMMARY_XP(elem).strip()}")
+        results.append(_parse_entry(elem))
+        if limit is not None and len(results) >= limit:
+            break
+        # Drop the finished entry and everything before it from the tree
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return results
+
+
 class ArxivRepository(RepositoryInterface):
     """arXiv repository implementation."""
 
-    def __init__(self) -> None:
-        """Initialize arXiv repository."""
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """Initialize arXiv repository.
+        
+        Args:
+            session: HTTP session to use; defaults to the shared session
+        """
         super().__init__()
         self.name = "arXiv"
         self.base_url = "http://export.arxiv.org/api/query"
         self.headers = {
             'User-Agent': 'semantic_corpus/1.0 (https://github.com/your-org/semantic_corpus; contact@example.com)'
         }
-        self.last_request_time = 0
+        self.session = session if session is not None else get_session()
         self.min_request_interval = 3.0  # arXiv requires 3 seconds between requests
+        self.max_retries = 4  # Extra attempts after a 429/503 response
+        self.retry_backoff = 3.0  # Base delay in seconds, doubled per attempt
+        self.max_download_workers = 1  # arXiv asks clients not to fetch in parallel
 
     def _rate_limit(self) -> None:
-        """Ensure we don't exceed arXiv's rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Ensure we don't exceed arXiv's rate limits.
+        
+        Each caller reserves the next free slot under a process-wide lock and
+        then sleeps outside it, so concurrent callers queue up
+        min_request_interval apart instead of racing.
+        """
+        global _next_request_at
+        with _RATE_LOCK:
+            now = time.monotonic()
+            wait = _next_request_at - now
+            _next_request_at = max(now, _next_request_at) + self.min_request_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a throttled response.
+        
+        Honours a numeric Retry-After header, otherwise backs off
+        exponentially with jitter.
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.retry_backoff * 2 ** attempt + random.random()
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> requests.Response:
+        """Make a rate-limited GET, retrying when arXiv answers 429 or 503.
+        
+        Args:
+            url: URL to fetch
+            params: Optional query parameters
+            stream: Leave the body unread, for write_response(); streamed
+                requests time out after DOWNLOAD_TIMEOUT seconds
+            
+        Returns:
+            The successful response
+            
+        Raises:
+            requests.HTTPError: If the request still fails after all retries
+        """
+        timeout = DOWNLOAD_TIMEOUT if stream else None
+        for attempt in range(self.max_retries + 1):
+            self._rate_limit()
+            response = self.session.get(
+                url, params=params, headers=self.headers, stream=stream, timeout=timeout
+            )
+            if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                break
+            response.close()
+            time.sleep(self._retry_delay(response, attempt))
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
 
     def _make_request(self, params: Dict[str, Any]) -> requests.Response:
         """Make a rate-limited request to arXiv API."""
-        self._rate_limit()
-        response = requests.get(self.base_url, params=params, headers=self.headers)
-        response.raise_for_status()
-        return response
+        return self._get(self.base_url, params)
 
     def search_papers(
         self,
@@ -69,18 +241,9 @@ class ArxivRepository(RepositoryInterface):
             response = self._make_request(params)
             
             # Parse XML response (arXiv returns XML, not JSON)
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.content)
-            
-            # Check for errors in the response
-            if root.find("{http://www.w3.org/2005/Atom}error") is not None:
-                error_msg = root.find("{http://www.w3.org/2005/Atom}error").text
-                raise RepositoryError(f"arXiv API error: {error_msg}")
-            
-            results = []
-            entries = root.findall("{http://www.w3.org/2005/Atom}entry")
+            results = _parse_feed(response.content, limit)
             
-            if not entries:
+            if not results:
                 # Try a simpler query if no results found
                 if categories:
                     simple_params = {
@@ -91,96 +254,56 @@ class ArxivRepository(RepositoryInterface):
                         "sortOrder": "descending"
                     }
                     response = self._make_request(simple_params)
-                    root = ET.fromstring(response.content)
-                    entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-            
-            for entry in entries:
-                # Extract arXiv ID
-                arxiv_id = entry.find("{http://www.w3.org/2005/Atom}id").text
-                arxiv_id = arxiv_id.split("/")[-1]  # Extract ID from URL
-                
-                # Extract title
-                title = entry.find("{http://www.w3.org/2005/Atom}title").text
-                
-                # Extract abstract
-                abstract = entry.find("{http://www.w3.org/2005/Atom}summary").text
-                
-                # Extract authors
-                authors = []
-                for author in entry.findall("{http://www.w3.org/2005/Atom}author"):
-                    name = author.find("{http://www.w3.org/2005/Atom}name").text
-                    authors.append({"name": name})
-                
-                # Extract publication date
-                published = entry.find("{http://www.w3.org/2005/Atom}published").text
-                
-                # Extract categories
-                categories_list = []
-                for category in entry.findall("{http://arxiv.org/schemas/atom}primary_category"):
-                    categories_list.append(category.get("term"))
-                
-                results.append({
-                    "arxiv_id": arxiv_id,
-                    "title": title,
-                    "abstract": abstract,
-                    "authors": authors,
-                    "publication_date": published,
-                    "categories": categories_list,
-                })
+                    results = _parse_feed(response.content, limit)
             
-            return results[:limit]
+            return results
             
-        except (requests.RequestException, ET.ParseError) as e:
+        except (requests.RequestException, etree.XMLSyntaxError) as e:
             raise RepositoryError(f"arXiv search failed: {e}")
 
     def get_paper_metadata(self, paper_id: str) -> Dict[str, Any]:
         """Get metadata for a specific paper from arXiv."""
-        try:
-            # arXiv API expects ID in format: 1234.5678 or cs/1234567
-            params = {
-                "id_list": paper_id,
-                "max_results": 1
-            }
-            
-            response = self._make_request(params)
-            
-            # Parse XML response
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.content)
-            
-            entry = root.find("{http://www.w3.org/2005/Atom}entry")
-            if entry is None:
-                raise RepositoryError(f"Paper {paper_id} not found")
-            
-            # Extract metadata (same as in search_papers)
-            arxiv_id = entry.find("{http://www.w3.org/2005/Atom}id").text
-            arxiv_id = arxiv_id.split("/")[-1]
-            
-            title = entry.find("{http://www.w3.org/2005/Atom}title").text
-            abstract = entry.find("{http://www.w3.org/2005/Atom}summary").text
-            
-            authors = []
-            for author in entry.findall("{http://www.w3.org/2005/Atom}author"):
-                name = author.find("{http://www.w3.org/2005/Atom}name").text
-                authors.append({"name": name})
-            
-            published = entry.find("{http://www.w3.org/2005/Atom}published").text
+        metadata = self.get_papers_metadata([paper_id])
+        if paper_id not in metadata:
+            raise RepositoryError(f"Paper {paper_id} not found")
+        return metadata[paper_id]
+
+    def get_papers_metadata(self, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for several papers, up to 200 per request.
+        
+        arXiv accepts a comma-separated id_list, so N papers cost
+        ceil(N / 200) rate-limited requests instead of N.
+        
+        Args:
+            paper_ids: arXiv IDs, with or without a version suffix
             
-            categories_list = []
-            for category in entry.findall("{http://arxiv.org/schemas/atom}primary_category"):
-                categories_list.append(category.get("term"))
+        Returns:
+            Dictionary mapping each requested ID that was found to its metadata
             
-            return {
-                "arxiv_id": arxiv_id,
-                "title": title,
-                "abstract": abstract,
-                "authors": authors,
-                "publication_date": published,
-                "categories": categories_list,
-            }
+        Raises:
+            RepositoryError: If a request fails or arXiv rejects an ID
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(paper_ids), _ID_LIST_BATCH_SIZE):
+            batch = paper_ids[start:start + _ID_LIST_BATCH_SIZE]
+            try:
+                # arXiv API expects ID in format: 1234.5678 or cs/1234567
+                params = {
+                    "id_list": ",".join(batch),
+                    "max_results": len(batch)
+                }
+                response = self._make_request(params)
+                entries = _parse_feed(response.content)
+            except (requests.RequestException, etree.XMLSyntaxError) as e:
+                raise RepositoryError(f"Failed to get metadata for {', '.join(batch)}: {e}")
             
-        except (requests.RequestException, ET.ParseError) as e:
-            raise RepositoryError(f"Failed to get metadata for {paper_id}: {e}")
+            # Entries carry versioned IDs (2301.00001v2), so match on the bare ID
+            by_id = {_bare_id(entry["arxiv_id"]): entry for entry in entries}
+            for paper_id in batch:
+                entry = by_id.get(_bare_id(paper_id))
+                if entry is not None:
+                    results[paper_id] = entry
+        return results
 
     def download_paper(
         self,
@@ -200,21 +323,17 @@ class ArxivRepository(RepositoryInterface):
                 if format_type == "pdf":
                     # Download PDF
                     pdf_url = f"http://arxiv.org/pdf/{paper_id}.pdf"
-                    response = requests.get(pdf_url, headers=self.headers)
-                    response.raise_for_status()
-                    
                     pdf_file = output_dir / f"{paper_id}.pdf"
-                    pdf_file.write_bytes(response.content)
+                    with self._get(pdf_url, stream=True) as response:
+                        write_response(response, pdf_file)
                     downloaded_files.append(str(pdf_file))
                 
                 elif format_type == "source":
                     # Download source (LaTeX)
                     source_url = f"http://arxiv.org/src/{paper_id}"
-                    response = requests.get(source_url, headers=self.headers)
-                    response.raise_for_status()
-                    
                     source_file = output_dir / f"{paper_id}.tar.gz"
-                    source_file.write_bytes(response.content)
+                    with self._get(source_url, stream=True) as response:
+                        write_response(response, source_file)
                     downloaded_files.append(str(source_file))
             
             return {
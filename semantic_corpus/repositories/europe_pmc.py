@@ -1,22 +1,43 @@
 """Europe PMC repository implementation."""
 
-import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+from semantic_corpus.core.http import DOWNLOAD_TIMEOUT, get_session, write_response
+from semantic_corpus.core.metadata_cache import MetadataCache
 from semantic_corpus.core.repository_interface import RepositoryInterface
 from semantic_corpus.core.exceptions import RepositoryError
+from semantic_corpus.utils import loads_json
+
+# Full-text endpoint suffix for each supported download format
+_FORMAT_ENDPOINTS = {
+    "xml": "fullTextXML",
+    "pdf": "fullTextPDF",
+}
 
 
 class EuropePMCRepository(RepositoryInterface):
     """Europe PMC repository implementation."""
 
-    def __init__(self) -> None:
-        """Initialize Europe PMC repository."""
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        cache: Optional[MetadataCache] = None
+    ) -> None:
+        """Initialize Europe PMC repository.
+        
+        Args:
+            session: HTTP session to use; defaults to the shared session
+            cache: Optional disk cache for get_paper_metadata responses
+        """
         super().__init__()
         self.name = "Europe PMC"
         self.base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest"
+        self.session = session if session is not None else get_session()
+        self.cache = cache
 
     def search_papers(
         self,
@@ -43,10 +64,10 @@ class EuropePMCRepository(RepositoryInterface):
                 params["query"] = f"({query}) AND (FIRST_PDATE:[TO {end_date}])"
             
             # Make API request
-            response = requests.get(f"{self.base_url}/search", params=params)
+            response = self.session.get(f"{self.base_url}/search", params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             results = []
             
             for paper in data.get("resultList", {}).get("result", []):
@@ -63,7 +84,7 @@ class EuropePMCRepository(RepositoryInterface):
             
             return results[:limit]
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             raise RepositoryError(f"Europe PMC search failed: {e}")
 
     def get_paper_metadata(self, paper_id: str) -> Dict[str, Any]:
@@ -75,9 +96,8 @@ class EuropePMCRepository(RepositoryInterface):
                 "format": "json",
                 "resultType": "core"
             }
-            response = requests.get(f"{self.base_url}/search", params=params)
-            response.raise_for_status()
-            data = response.json()
+            body = self._cached_get(f"europe_pmc:{paper_id}", f"{self.base_url}/search", params)
+            data = loads_json(body)
             
             if not data.get("resultList", {}).get("result"):
                 raise RepositoryError(f"Paper {paper_id} not found")
@@ -95,9 +115,42 @@ class EuropePMCRepository(RepositoryInterface):
                 "doi": paper.get("doi", ""),
             }
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             raise RepositoryError(f"Failed to get metadata for {paper_id}: {e}")
 
+    def _cached_get(self, key: str, url: str, params: Dict[str, Any]) -> bytes:
+        """GET a response body, going through self.cache when one is set.
+        
+        A fresh cache entry is returned without a request. A stale one is
+        revalidated with its ETag/Last-Modified, and a 304 reply reuses the
+        cached body.
+        
+        Args:
+            key: Cache key for the response
+            url: URL to fetch
+            params: Query parameters
+            
+        Returns:
+            Raw response body
+        """
+        if self.cache is None:
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            return response.content
+        
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            return entry.body
+        
+        headers = entry.conditional_headers() if entry is not None else {}
+        response = self.session.get(url, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(key, response.headers)
+            return entry.body
+        response.raise_for_status()
+        self.cache.store(key, response.content, response.headers)
+        return response.content
+
     def download_paper(
         self,
         paper_id: str,
@@ -110,7 +163,6 @@ class EuropePMCRepository(RepositoryInterface):
         
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
-            downloaded_files = []
             
             # Get PMCID for download - if paper_id is PMID, search for PMCID
             if not paper_id.startswith("PMC") and not paper_id.startswith("PPR"):
@@ -120,9 +172,9 @@ class EuropePMCRepository(RepositoryInterface):
                     "format": "json",
                     "resultType": "core"
                 }
-                search_response = requests.get(f"{self.base_url}/search", params=search_params)
+                search_response = self.session.get(f"{self.base_url}/search", params=search_params)
                 search_response.raise_for_status()
-                search_data = search_response.json()
+                search_data = loads_json(search_response.content)
                 
                 if not search_data.get("resultList", {}).get("result"):
                     raise RepositoryError(f"Paper {paper_id} not found")
@@ -140,36 +192,71 @@ class EuropePMCRepository(RepositoryInterface):
                 else:
                     download_id = paper_id
             
-            for format_type in formats:
-                if format_type == "xml":
-                    # Download XML using correct endpoint format
-                    xml_url = f"{self.base_url}/PMC{download_id}/fullTextXML"
-                    response = requests.get(xml_url)
-                    response.raise_for_status()
-                    
-                    xml_file = output_dir / f"{paper_id}.xml"
-                    xml_file.write_bytes(response.content)
-                    downloaded_files.append(str(xml_file))
-                
-                elif format_type == "pdf":
-                    # Download PDF using correct endpoint format
-                    pdf_url = f"{self.base_url}/PMC{download_id}/fullTextPDF"
-                    response = requests.get(pdf_url)
-                    response.raise_for_status()
-                    
-                    pdf_file = output_dir / f"{paper_id}.pdf"
-                    pdf_file.write_bytes(response.content)
-                    downloaded_files.append(str(pdf_file))
+            # Each format is a separate request, so fetch them side by side
+            wanted = [f for f in dict.fromkeys(formats) if f in _FORMAT_ENDPOINTS]
+            fetch = partial(self._try_download_format, paper_id, download_id, output_dir=output_dir)
+            if len(wanted) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(wanted))) as executor:
+                    outcomes = list(executor.map(fetch, wanted))
+            else:
+                outcomes = [fetch(f) for f in wanted]
             
-            return {
-                "success": True,
+            downloaded_files = [path for path, _ in outcomes if path is not None]
+            errors = [error for _, error in outcomes if error is not None]
+            if errors and not downloaded_files:
+                raise RepositoryError(f"Failed to download {paper_id}: {'; '.join(errors)}")
+            
+            result = {
+                "success": not errors,
                 "paper_id": paper_id,
                 "files": downloaded_files
             }
+            # Formats that did arrive are kept; the rest are reported
+            if errors:
+                result["error"] = "; ".join(errors)
+            return result
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             raise RepositoryError(f"Failed to download {paper_id}: {e}")
 
+    def _download_format(
+        self,
+        paper_id: str,
+        download_id: str,
+        format_type: str,
+        output_dir: Path
+    ) -> str:
+        """Download one full-text format of a paper.
+        
+        Args:
+            paper_id: Paper ID used to name the output file
+            download_id: Numeric PMC ID (or PPR ID) for the endpoint
+            format_type: Key of _FORMAT_ENDPOINTS ("xml" or "pdf")
+            output_dir: Directory to write the file to
+            
+        Returns:
+            Path of the written file, as a string
+        """
+        url = f"{self.base_url}/PMC{download_id}/{_FORMAT_ENDPOINTS[format_type]}"
+        out_file = output_dir / f"{paper_id}.{format_type}"
+        with self.session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            write_response(response, out_file)
+        return str(out_file)
+
+    def _try_download_format(
+        self,
+        paper_id: str,
+        download_id: str,
+        format_type: str,
+        output_dir: Path
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Download one format, returning (path, None) or (None, error message)."""
+        try:
+            return self._download_format(paper_id, download_id, format_type, output_dir), None
+        except (requests.RequestException, OSError) as e:
+            return None, f"{format_type}: {e}"
+
     def get_repository_info(self) -> Dict[str, Any]:
         """Get information about Europe PMC repository."""
         return {
@@ -1,8 +1,133 @@
 """BAGIT bag management for semantic corpus."""
 
+import hashlib
+import json
+import os
+import re
 import bagit
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+# Read size for the hashing fallback used when hashlib.file_digest is missing
+# (Python < 3.11) or several algorithms share one pass over the file
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_LINE_BREAK_RE = re.compile(r"[\r\n]")
+
+# New bags get a single SHA-256 manifest: hashlib's OpenSSL SHA-256 uses the
+# CPU's SHA extensions where present, and one algorithm means one hashing
+# pass through hashlib.file_digest instead of bagit's sha256+sha512 default
+_CHECKSUMS = ["sha256"]
+
+# Payload size from which validate_bag hashes in a process pool by default
+_PARALLEL_VALIDATE_MIN_BYTES = 64 * 1024 * 1024
+
+# Corpus layout made by create_structured_directories; relations, analysis
+# and provenance sit outside data/ as they are not BAGIT payload
+_STRUCTURED_DIRS: Tuple[Tuple[str, ...], ...] = (
+    ("data", "documents", "pdf"),
+    ("data", "documents", "xml"),
+    ("data", "documents", "html"),
+    ("data", "semantic"),
+    ("data", "metadata"),
+    ("data", "keyphrases"),
+    ("data", "indices"),
+    ("relations",),
+    ("analysis",),
+    ("provenance",),
+)
+
+# Digests from the last update_manifest, keyed by payload path with the
+# size and mtime they were computed for. A local cache, not bag content:
+# hidden, and never listed in the tag manifests.
+_MANIFEST_CACHE = ".manifest-cache.json"
+
+# Suffix of the temporary files tag files are written to before being
+# renamed into place
+_TMP_SUFFIX = ".tmp"
+
+
+def _file_digests(path: Path, algorithms: List[str]) -> Dict[str, str]:
+    """Hash a file with each algorithm and return the hex digests.
+    
+    A single algorithm goes through hashlib.file_digest, which runs the read
+    loop in C. Otherwise the file is read once into a reused buffer that
+    feeds every hasher.
+    
+    Args:
+        path: File to hash
+        algorithms: hashlib algorithm names, e.g. ['sha256']
+        
+    Returns:
+        Dictionary of algorithm -> hex digest
+    """
+    with open(path, "rb") as f:
+        if len(algorithms) == 1 and hasattr(hashlib, "file_digest"):
+            algorithm = algorithms[0]
+            return {algorithm: hashlib.file_digest(f, algorithm).hexdigest()}
+        
+        hashers = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            for hasher in hashers.values():
+                hasher.update(view[:count])
+        return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+
+def _parse_tag_file(path: Path) -> Dict[str, Any]:
+    """Parse a BagIt tag file such as bag-info.txt into a dictionary.
+    
+    Follows bagit's reading rules: blank lines are skipped, lines starting
+    with whitespace continue the previous value, and a repeated tag collects
+    its values in a list.
+    
+    Args:
+        path: Tag file to read (UTF-8, with or without a BOM)
+        
+    Returns:
+        Dictionary of tag name to value, or list of values
+        
+    Raises:
+        ValueError: If a line is neither a tag nor a continuation
+    """
+    tags: Dict[str, Any] = {}
+    
+    def add(name: str, value: str) -> None:
+        value = value.strip()
+        if name not in tags:
+            tags[name] = value
+        elif isinstance(tags[name], list):
+            tags[name].append(value)
+        else:
+            tags[name] = [tags[name], value]
+    
+    name: Optional[str] = None
+    value = ""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            if not line or line.isspace():
+                continue
+            if line[0].isspace() and name is not None:
+                value += line
+                continue
+            if name is not None:
+                add(name, value)
+            if ":" not in line:
+                raise ValueError(f"{Path(path).name} contains invalid tag: {line.strip()}")
+            name, value = line.strip().split(":", 1)
+            name = name.strip()
+    if name is not None:
+        add(name, value)
+    return tags
+
+
+def _manifest_path(relative_path: str) -> str:
+    """Encode a bag-relative path for a manifest line as bagit does."""
+    return relative_path.replace("\r", "%0D").replace("\n", "%0A")
 
 
 class BagitManager:
@@ -15,6 +140,9 @@ class BagitManager:
             bag_dir: Path to the bag directory
         """
         self.bag_dir = Path(bag_dir)
+        # Payload directory, also as a string for the os-level manifest walk
+        self._data_dir = Path(self.bag_dir, "data")
+        self._data_dir_str = str(self._data_dir)
 
     def create_bag(self, metadata: Optional[Dict[str, str]] = None) -> None:
         """Create a BAGIT-compliant bag structure.
@@ -26,7 +154,7 @@ class BagitManager:
         self.bag_dir.mkdir(parents=True, exist_ok=True)
         
         # Create data directory (required by BAGIT)
-        data_dir = Path(self.bag_dir, "data")
+        data_dir = self._data_dir
         data_dir.mkdir(parents=True, exist_ok=True)
         
         # BAGIT requires at least one file in data/ to be valid
@@ -36,11 +164,11 @@ class BagitManager:
             placeholder.touch()
         
         # Create bag using bagit library (bag_info parameter, not metadata)
-        bag = bagit.make_bag(str(self.bag_dir), bag_info=metadata)
+        bag = bagit.make_bag(str(self.bag_dir), bag_info=metadata, checksums=_CHECKSUMS)
         
         # Verify bag was created (check for required files)
         # bagit.txt and bag-info.txt are always created
-        # manifest files depend on checksum algorithm (default is SHA256/SHA512)
+        # manifest files depend on checksum algorithm (_CHECKSUMS)
         required_files = ["bagit.txt", "bag-info.txt"]
         for file_name in required_files:
             if not Path(self.bag_dir, file_name).exists():
@@ -50,25 +178,212 @@ class BagitManager:
         if not bag.is_valid():
             raise ValueError(f"Failed to create valid BAGIT bag at {self.bag_dir}")
 
-    def validate_bag(self) -> bool:
+    def validate_bag(self, processes: Optional[int] = None) -> bool:
         """Validate that the directory is a valid BAGIT bag.
         
+        Args:
+            processes: Worker processes for checksum verification. None uses
+                one per CPU for bags with at least 64 MiB of payload and a
+                single process for smaller bags, where starting a pool would
+                cost more than it saves.
+        
         Returns:
             True if valid, False otherwise
         """
         try:
             bag = bagit.Bag(str(self.bag_dir))
-            return bag.is_valid()
+            if processes is None:
+                processes = self._validation_processes(bag)
+            return bag.is_valid(processes=processes)
         except (bagit.BagError, OSError):
             return False
 
+    @staticmethod
+    def _validation_processes(bag: bagit.Bag) -> int:
+        """Pick the validation process count from the bag's Payload-Oxum."""
+        oxum = bag.info.get("Payload-Oxum", "")
+        try:
+            payload_bytes = int(oxum.split(".")[0])
+        except (AttributeError, ValueError):
+            return 1
+        if payload_bytes < _PARALLEL_VALIDATE_MIN_BYTES:
+            return 1
+        return os.cpu_count() or 1
+
     def update_manifest(self) -> None:
-        """Update the bag manifest after adding/modifying files."""
+        """Update the bag manifest after adding/modifying files.
+        
+        Rewrites the payload manifests, the Payload-Oxum in bag-info.txt and
+        the tag manifests for the algorithms the bag already uses. Unlike
+        bagit's Bag.save() this never changes the working directory, so it
+        is safe to call while other threads are running. Payload files whose
+        size and mtime match .manifest-cache.json, and that were last
+        modified before the previous update started, are not re-hashed.
+        """
         try:
             bag = bagit.Bag(str(self.bag_dir))
-            bag.save(manifests=True)
         except bagit.BagError as e:
             raise ValueError(f"Failed to update manifest: {e}")
+        
+        algorithms = list(bag.algorithms)
+        encoding = bag.encoding
+        started_ns = self._filesystem_time_ns()
+        previous, cached_ns = self._read_manifest_cache()
+        index: Dict[str, Any] = {}
+        manifest_lines: Dict[str, List[str]] = {algorithm: [] for algorithm in algorithms}
+        total_bytes = 0
+        total_files = 0
+        for relative_path, file_path in self._walk_payload():
+            st = os.stat(file_path)
+            cached = previous.get(relative_path)
+            # Reuse digests for files unchanged since the last update. A file
+            # whose mtime is not older than the start of that update may have
+            # been written again within the same timestamp tick, so it is
+            # re-hashed. Both times come from the bag's filesystem clock.
+            if (
+                cached is not None
+                and cached["size"] == st.st_size
+                and cached["mtime_ns"] == st.st_mtime_ns
+                and st.st_mtime_ns < cached_ns
+                and all(algorithm in cached["digests"] for algorithm in algorithms)
+            ):
+                digests = cached["digests"]
+            else:
+                digests = _file_digests(file_path, algorithms)
+            # The one stat above serves the index check, the index and Payload-Oxum
+            size = st.st_size
+            index[relative_path] = {"size": size, "mtime_ns": st.st_mtime_ns, "digests": digests}
+            entry = _manifest_path(relative_path)
+            for algorithm in algorithms:
+                manifest_lines[algorithm].append(f"{digests[algorithm]}  {entry}\n")
+            total_bytes += size
+            total_files += 1
+        
+        for algorithm, lines in manifest_lines.items():
+            self._write_tag_file(f"manifest-{algorithm}.txt", "".join(lines), encoding)
+        self._write_tag_file(_MANIFEST_CACHE, json.dumps({"files": index}), "utf-8")
+        # Date the cache to when this walk started; its mtime is the cutoff
+        # the next update compares payload mtimes against
+        os.utime(Path(self.bag_dir, _MANIFEST_CACHE), ns=(started_ns, started_ns))
+        
+        info = dict(bag.info)
+        info["Payload-Oxum"] = f"{total_bytes}.{total_files}"
+        self._write_tag_file(bag.tag_file_name, self._format_bag_info(info), encoding)
+        
+        # Tag manifests cover bagit.txt, bag-info.txt and the manifests just written
+        tag_files = list(self._walk_tag_files())
+        for algorithm in algorithms:
+            lines = []
+            for relative_path in tag_files:
+                digests = _file_digests(Path(self.bag_dir, relative_path), [algorithm])
+                lines.append(f"{digests[algorithm]} {relative_path}\n")
+            self._write_tag_file(f"tagmanifest-{algorithm}.txt", "".join(lines), encoding)
+
+    def _read_manifest_cache(self) -> Tuple[Dict[str, Any], int]:
+        """Load the digest cache written by the last update_manifest.
+        
+        Returns:
+            Tuple of (payload path -> size/mtime_ns/digests, the cache file's
+            mtime in ns); empty and 0 when missing or unreadable
+        """
+        path = Path(self.bag_dir, _MANIFEST_CACHE)
+        try:
+            cached_ns = os.stat(path).st_mtime_ns
+            cache = json.loads(path.read_text(encoding="utf-8"))
+            return dict(cache["files"]), cached_ns
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, 0
+
+    def _filesystem_time_ns(self) -> int:
+        """Return the current time as the bag's filesystem records it.
+        
+        Taken from the mtime of a freshly written file, so it has the same
+        granularity as payload mtimes, unlike time.time_ns().
+        """
+        probe = Path(self.bag_dir, f".{_MANIFEST_CACHE}{_TMP_SUFFIX}")
+        try:
+            probe.write_bytes(b"")
+            return os.stat(probe).st_mtime_ns
+        finally:
+            probe.unlink(missing_ok=True)
+
+    def _walk_payload(self) -> Iterator[Tuple[str, str]]:
+        """Yield (bag-relative POSIX path, filesystem path) for each payload file.
+        
+        Files come in bagit's order: a directory's files sorted by name, then
+        its subdirectories in sorted order. Like os.walk, symlinked
+        directories are not followed. Paths are built as strings, since
+        pathlib objects per file add up in bags with many files.
+        """
+        yield from self._walk_dir(self._data_dir_str, "data")
+
+    def _walk_dir(self, path: str, relative: str) -> Iterator[Tuple[str, str]]:
+        """Recursive step of _walk_payload for one directory."""
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+            else:
+                yield f"{relative}/{entry.name}", entry.path
+        for entry in subdirs:
+            yield from self._walk_dir(entry.path, f"{relative}/{entry.name}")
+
+    def _walk_tag_files(self) -> Iterator[str]:
+        """Yield tag file paths relative to the bag: everything outside data/ except tag manifests.
+        
+        The manifest cache and temporary files are skipped too, as they are
+        not part of the bag.
+        """
+        for name in sorted(os.listdir(self.bag_dir)):
+            if name == "data":
+                continue
+            path = Path(self.bag_dir, name)
+            if path.is_file():
+                if (
+                    not name.startswith("tagmanifest-")
+                    and name != _MANIFEST_CACHE
+                    and not name.endswith(_TMP_SUFFIX)
+                ):
+                    yield name
+                continue
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if not filename.startswith("tagmanifest-"):
+                        yield Path(dirpath, filename).relative_to(self.bag_dir).as_posix()
+
+    @staticmethod
+    def _format_bag_info(info: Dict[str, Any]) -> str:
+        """Serialize bag-info tags in bagit's layout: sorted, one line per value."""
+        lines = []
+        for header in sorted(info):
+            values = info[header]
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                # Strip CR/LF so a value cannot break the tag file
+                value = _LINE_BREAK_RE.sub("", str(value))
+                lines.append(f"{header}: {value}\n")
+        return "".join(lines)
+
+    def _write_tag_file(self, name: str, content: str, encoding: str) -> None:
+        """Write a tag file at the bag root, replacing any old one atomically.
+        
+        The encoded content is written in one call to a temporary file that
+        is then renamed over the target, so an interrupted update never
+        leaves a truncated manifest behind.
+        """
+        path = Path(self.bag_dir, name)
+        tmp_path = Path(self.bag_dir, f".{name}{_TMP_SUFFIX}")
+        try:
+            tmp_path.write_bytes(content.encode(encoding))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def get_bag_info(self) -> Dict[str, str]:
         """Get bag information from bag-info.txt.
@@ -76,10 +391,13 @@ class BagitManager:
         Returns:
             Dictionary of bag metadata
         """
+        # Reads bag-info.txt directly: opening a bagit.Bag would also load
+        # every manifest just to hand back these few tags
+        if not Path(self.bag_dir, "bagit.txt").is_file():
+            return {}
         try:
-            bag = bagit.Bag(str(self.bag_dir))
-            return dict(bag.info)
-        except (bagit.BagError, OSError):
+            return _parse_tag_file(Path(self.bag_dir, "bag-info.txt"))
+        except (OSError, ValueError):
             return {}
 
     def create_structured_directories(self) -> None:
@@ -95,23 +413,8 @@ class BagitManager:
         - analysis/
         - provenance/
         """
-        # Ensure data directory exists (required by BAGIT)
-        data_dir = Path(self.bag_dir, "data")
-        data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Document directories
-        Path(data_dir, "documents", "pdf").mkdir(parents=True, exist_ok=True)
-        Path(data_dir, "documents", "xml").mkdir(parents=True, exist_ok=True)
-        Path(data_dir, "documents", "html").mkdir(parents=True, exist_ok=True)
-        
-        # Semantic and metadata directories
-        Path(data_dir, "semantic").mkdir(parents=True, exist_ok=True)
-        Path(data_dir, "metadata").mkdir(parents=True, exist_ok=True)
-        Path(data_dir, "keyphrases").mkdir(parents=True, exist_ok=True)
-        Path(data_dir, "indices").mkdir(parents=True, exist_ok=True)
-        
-        # Relations, analysis, and provenance (outside data/ for non-BAGIT files)
-        Path(self.bag_dir, "relations").mkdir(parents=True, exist_ok=True)
-        Path(self.bag_dir, "analysis").mkdir(parents=True, exist_ok=True)
-        Path(self.bag_dir, "provenance").mkdir(parents=True, exist_ok=True)
+        # mkdir with exist_ok is one syscall per leaf when the tree already
+        # exists; parents=True creates data/ (required by BAGIT) on first use
+        for parts in _STRUCTURED_DIRS:
+            Path(self.bag_dir, *parts).mkdir(parents=True, exist_ok=True)
 
@@ -1,10 +1,102 @@
 """Metadata extraction functionality."""
 
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from lxml import etree
 
 from semantic_corpus.core.exceptions import MetadataError
+from semantic_corpus.utils import read_json_file
+
+# Parser options for metadata streaming. Downloaded XML is untrusted, so
+# libxml2's depth and size limits stay on and entities are not resolved;
+# dropping whitespace-only text, comments and PIs avoids allocating nodes
+# that are never read.
+_ITERPARSE_OPTIONS = {
+    'resolve_entities': False,
+    'remove_blank_text': True,
+    'remove_comments': True,
+    'remove_pis': True,
+    'no_network': True,
+}
+
+
+def extract_xml_fields(xml_path: Path) -> Dict[str, Any]:
+    """Stream an XML file and collect title, abstract, DOI and author names.
+    
+    Uses lxml's iterparse and discards each element once it has been read,
+    so memory stays proportional to the tree depth rather than the size of
+    the document. The first title/abstract/doi element wins, as with find().
+    
+    Args:
+        xml_path: Path to XML file
+        
+    Returns:
+        Metadata dictionary with any of title, abstract, doi, plus authors
+    """
+    metadata: Dict[str, Any] = {}
+    authors: List[str] = []
+    
+    for _, elem in etree.iterparse(str(xml_path), events=("end",), **_ITERPARSE_OPTIONS):
+        tag = elem.tag
+        if tag in ('title', 'abstract', 'doi'):
+            metadata.setdefault(tag, elem.text or "")
+        elif tag == 'author' and elem.text:
+            authors.append(elem.text)
+        
+        # Free the finished element and any siblings already processed
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+    
+    metadata['authors'] = authors
+    return metadata
+
+
+def extract_pdf_fields(pdf_path: Path) -> Dict[str, Any]:
+    """Collect file details plus title, author and creator from a PDF.
+    
+    PyMuPDF opens the document from its cross-reference table and only
+    resolves the Info dictionary when metadata is read, so page content is
+    never loaded. Without PyMuPDF, or for a malformed/partial PDF, only the
+    file details are returned.
+    
+    Args:
+        pdf_path: Path to PDF file
+        
+    Returns:
+        Metadata dictionary with file_path, file_type, file_size and any of
+        title, authors, creator
+    """
+    metadata: Dict[str, Any] = {
+        'file_path': str(pdf_path),
+        'file_type': 'pdf',
+        'file_size': pdf_path.stat().st_size,
+    }
+    
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        # PyMuPDF not available, use basic metadata
+        return metadata
+    
+    try:
+        with fitz.open(str(pdf_path)) as doc:
+            pdf_metadata = doc.metadata or {}
+    except Exception:
+        # PyMuPDF is available but the PDF may be malformed/partial.
+        # Fall back to basic file metadata rather than failing.
+        return metadata
+    
+    if pdf_metadata.get('title'):
+        metadata['title'] = pdf_metadata['title']
+    if pdf_metadata.get('author'):
+        metadata['authors'] = [pdf_metadata['author']]
+    if pdf_metadata.get('creator'):
+        metadata['creator'] = pdf_metadata['creator']
+    return metadata
 
 
 class MetadataExtractor:
@@ -12,7 +104,11 @@ class MetadataExtractor:
 
     def __init__(self) -> None:
         """Initialize metadata extractor."""
-        pass
+        self._dispatch = {
+            '.xml': self.extract_from_xml,
+            '.pdf': self.extract_from_pdf,
+            '.json': self.extract_from_json,
+        }
 
     def extract_from_xml(self, xml_path: Path) -> Dict[str, Any]:
         """Extract metadata from XML file.
@@ -24,37 +120,7 @@ class MetadataExtractor:
             Extracted metadata dictionary
         """
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            metadata = {}
-            
-            # Extract title
-            title_elem = root.find('.//title')
-            if title_elem is not None:
-                metadata['title'] = title_elem.text or ""
-            
-            # Extract abstract
-            abstract_elem = root.find('.//abstract')
-            if abstract_elem is not None:
-                metadata['abstract'] = abstract_elem.text or ""
-            
-            # Extract DOI
-            doi_elem = root.find('.//doi')
-            if doi_elem is not None:
-                metadata['doi'] = doi_elem.text or ""
-            
-            # Extract authors
-            authors = []
-            for author in root.findall('.//author'):
-                name = author.text
-                if name:
-                    authors.append(name)
-            metadata['authors'] = authors
-            
-            return metadata
-            
+            return extract_xml_fields(xml_path)
         except Exception as e:
             raise MetadataError(f"Failed to extract metadata from XML: {e}")
 
@@ -68,35 +134,7 @@ class MetadataExtractor:
             Extracted metadata dictionary
         """
         try:
-            metadata = {
-                'file_path': str(pdf_path),
-                'file_type': 'pdf',
-                'file_size': pdf_path.stat().st_size,
-            }
-            
-            # Try to extract basic metadata using PyMuPDF (fitz) if available
-            try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(str(pdf_path))
-                if doc.metadata:
-                    pdf_metadata = doc.metadata
-                    if pdf_metadata.get('title'):
-                        metadata['title'] = pdf_metadata['title']
-                    if pdf_metadata.get('author'):
-                        metadata['authors'] = [pdf_metadata['author']]
-                    if pdf_metadata.get('creator'):
-                        metadata['creator'] = pdf_metadata['creator']
-                doc.close()
-            except ImportError:
-                # PyMuPDF not available, use basic metadata
-                pass
-            except Exception:
-                # PyMuPDF is available but the PDF may be malformed/partial.
-                # Fall back to basic file metadata rather than failing.
-                pass
-            
-            return metadata
-            
+            return extract_pdf_fields(pdf_path)
         except Exception as e:
             raise MetadataError(f"Failed to extract metadata from PDF: {e}")
 
@@ -110,9 +148,7 @@ class MetadataExtractor:
             Extracted metadata dictionary
         """
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            return metadata
+            return read_json_file(json_path)
             
         except Exception as e:
             raise MetadataError(f"Failed to extract metadata from JSON: {e}")
@@ -133,12 +169,7 @@ class MetadataExtractor:
             raise MetadataError(f"File not found: {file_path}")
         
         suffix = file_path.suffix.lower()
-        
-        if suffix == '.xml':
-            return self.extract_from_xml(file_path)
-        elif suffix == '.pdf':
-            return self.extract_from_pdf(file_path)
-        elif suffix == '.json':
-            return self.extract_from_json(file_path)
-        else:
+        extract = self._dispatch.get(suffix)
+        if extract is None:
             raise MetadataError(f"Unsupported file format: {suffix}")
+        return extract(file_path)
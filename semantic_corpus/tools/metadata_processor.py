@@ -2,10 +2,46 @@
 
 import json
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from semantic_corpus.core.exceptions import MetadataError
+from semantic_corpus.tools.metadata_extractor import extract_pdf_fields, extract_xml_fields
+from semantic_corpus.tools.metadata_validator import REQUIRED_FIELDS
+from semantic_corpus.utils import intern_short
+
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Common stop words filtered out of keyword extraction
+_STOPWORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
+    'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'must', 'can', 'shall', 'a', 'an', 'some', 'any', 'all', 'both',
+    'each', 'every', 'no', 'not', 'only', 'also', 'just', 'even',
+    'still', 'yet', 'already', 'here', 'there', 'where', 'when', 'why',
+    'how', 'what', 'which', 'who', 'whom', 'whose',
+})
+
+# Field variations (lowercased, with spaces and hyphens folded to
+# underscores) mapped to standard names
+_KEY_MAP = {
+    'title': 'title',
+    'abstract': 'abstract',
+    'abstracttext': 'abstract',
+    'doi': 'doi',
+    'authors': 'authors',
+    'authorlist': 'authors',
+    'publication_date': 'publication_date',
+    'firstpublicationdate': 'publication_date',
+    'journal': 'journal',
+    'journaltitle': 'journal',
+}
+_KEY_CANON = str.maketrans({' ': '_', '-': '_'})
 
 
 class MetadataProcessor:
@@ -25,37 +61,7 @@ class MetadataProcessor:
             Processed metadata dictionary
         """
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            metadata = {}
-            
-            # Extract title
-            title_elem = root.find('.//title')
-            if title_elem is not None:
-                metadata['title'] = title_elem.text or ""
-            
-            # Extract abstract
-            abstract_elem = root.find('.//abstract')
-            if abstract_elem is not None:
-                metadata['abstract'] = abstract_elem.text or ""
-            
-            # Extract DOI
-            doi_elem = root.find('.//doi')
-            if doi_elem is not None:
-                metadata['doi'] = doi_elem.text or ""
-            
-            # Extract authors
-            authors = []
-            for author in root.findall('.//author'):
-                name = author.text
-                if name:
-                    authors.append(name)
-            metadata['authors'] = authors
-            
-            return metadata
-            
+            return extract_xml_fields(xml_path)
         except Exception as e:
             raise MetadataError(f"Failed to process XML metadata: {e}")
 
@@ -69,36 +75,7 @@ class MetadataProcessor:
             Processed metadata dictionary
         """
         try:
-            # Basic PDF metadata extraction
-            metadata = {
-                'file_path': str(pdf_path),
-                'file_type': 'pdf',
-                'file_size': pdf_path.stat().st_size,
-            }
-            
-            # Try to extract basic metadata using PyMuPDF (fitz) if available
-            try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(str(pdf_path))
-                if doc.metadata:
-                    pdf_metadata = doc.metadata
-                    if pdf_metadata.get('title'):
-                        metadata['title'] = pdf_metadata['title']
-                    if pdf_metadata.get('author'):
-                        metadata['authors'] = [pdf_metadata['author']]
-                    if pdf_metadata.get('creator'):
-                        metadata['creator'] = pdf_metadata['creator']
-                doc.close()
-            except ImportError:
-                # PyMuPDF not available, use basic metadata
-                pass
-            except Exception:
-                # PyMuPDF is available but the PDF may be malformed/partial.
-                # Fall back to basic file metadata rather than failing.
-                pass
-            
-            return metadata
-            
+            return extract_pdf_fields(pdf_path)
         except Exception as e:
             raise MetadataError(f"Failed to process PDF metadata: {e}")
 
@@ -111,33 +88,16 @@ class MetadataProcessor:
         Returns:
             Normalized metadata dictionary
         """
-        normalized = {}
-        
-        # Map common field variations to standard names
-        field_mapping = {
-            'Title': 'title',
-            'title': 'title',
-            'Abstract': 'abstract',
-            'abstract': 'abstract',
-            'AbstractText': 'abstract',
-            'DOI': 'doi',
-            'doi': 'doi',
-            'Authors': 'authors',
-            'authors': 'authors',
-            'AuthorList': 'authors',
-            'Publication_Date': 'publication_date',
-            'publication_date': 'publication_date',
-            'firstPublicationDate': 'publication_date',
-            'Journal': 'journal',
-            'journal': 'journal',
-            'journalTitle': 'journal',
+        # Short values (journal, dates, author names) repeat across papers,
+        # so they are interned to share one string object per value
+        return {
+            _KEY_MAP.get(key.lower().translate(_KEY_CANON), key.lower()): (
+                [intern_short(v) for v in value]
+                if isinstance(value, list)
+                else intern_short(value)
+            )
+            for key, value in raw_metadata.items()
         }
-        
-        for key, value in raw_metadata.items():
-            normalized_key = field_mapping.get(key, key.lower())
-            normalized[normalized_key] = value
-        
-        return normalized
 
     def validate_metadata(self, metadata: Dict[str, Any]) -> bool:
         """Validate metadata completeness.
@@ -148,13 +108,7 @@ class MetadataProcessor:
         Returns:
             True if metadata is valid, False otherwise
         """
-        required_fields = ['title', 'abstract', 'doi', 'authors', 'publication_date']
-        
-        for field in required_fields:
-            if field not in metadata or not metadata[field]:
-                return False
-        
-        return True
+        return all(metadata.get(field) for field in REQUIRED_FIELDS)
 
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """Extract keywords from text using simple frequency analysis.
@@ -169,29 +123,10 @@ class MetadataProcessor:
         if not text:
             return []
         
-        # Simple keyword extraction using word frequency
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
-            'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'is', 'are',
-            'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do',
-            'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-            'must', 'can', 'shall', 'a', 'an', 'some', 'any', 'all', 'both',
-            'each', 'every', 'no', 'not', 'only', 'also', 'just', 'even',
-            'still', 'yet', 'already', 'here', 'there', 'where', 'when', 'why',
-            'how', 'what', 'which', 'who', 'whom', 'whose'
-        }
-        
-        # Count word frequencies
-        word_counts = {}
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_counts[word] = word_counts.get(word, 0) + 1
+        # Simple keyword extraction using word frequency; words shorter than
+        # four letters never count, so the pattern skips them up front
+        words = _WORD_RE.findall(text.lower())
         
-        # Sort by frequency and return top keywords
-        sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, count in sorted_words[:max_keywords]]
+        # Count word frequencies; most_common keeps first-seen order for ties
+        word_counts = Counter(word for word in words if word not in _STOPWORDS)
+        return [word for word, _ in word_counts.most_common(max_keywords)]
@@ -1,9 +1,17 @@
 """Metadata validation functionality."""
 
 import re
-from datetime import datetime
+from datetime import date
 from typing import Dict, Any, List
 
+# Compiled once at import; the validators run for every paper during ingestion
+_DOI_RE = re.compile(r'^10\.\d{4,}/[^\s]+$')
+_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+
+# Fields a complete paper record must have; also used by MetadataProcessor
+REQUIRED_FIELDS = ('title', 'abstract', 'doi', 'authors', 'publication_date')
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+
 
 class MetadataValidator:
     """Validates metadata fields and formats."""
@@ -25,8 +33,7 @@ class MetadataValidator:
             return False
         
         # Basic DOI pattern validation
-        doi_pattern = r'^10\.\d{4,}/[^\s]+$'
-        return bool(re.match(doi_pattern, doi.strip()))
+        return _DOI_RE.match(doi.strip()) is not None
 
     def validate_publication_date(self, date_str: str) -> bool:
         """Validate publication date format.
@@ -40,9 +47,19 @@ class MetadataValidator:
         if not date_str or not isinstance(date_str, str):
             return False
         
+        date_str = date_str.strip()
+        match = _DATE_RE.match(date_str)
+        if match is None:
+            return False
+        
         try:
-            # Try to parse the date
-            datetime.strptime(date_str.strip(), '%Y-%m-%d')
+            # Reject out-of-range values such as month 13 or February 30
+            if len(date_str) == 10:
+                # Zero-padded YYYY-MM-DD, the usual form, goes through the C-level parser
+                date.fromisoformat(date_str)
+            else:
+                year, month, day = (int(part) for part in match.groups())
+                date(year, month, day)
             return True
         except ValueError:
             return False
@@ -56,18 +73,15 @@ class MetadataValidator:
         Returns:
             True if all required fields are present, False otherwise
         """
-        required_fields = ['title', 'abstract', 'doi', 'authors', 'publication_date']
+        # One C-level subset check rejects records with missing keys
+        if not _REQUIRED_FIELD_SET.issubset(metadata.keys()):
+            return False
         
-        for field in required_fields:
-            if field not in metadata:
-                return False
-            
+        for field in REQUIRED_FIELDS:
             value = metadata[field]
+            # Empty strings, lists and None are all falsy
             if not value or (isinstance(value, str) and not value.strip()):
                 return False
-            
-            if isinstance(value, list) and len(value) == 0:
-                return False
         
         return True
 
@@ -131,8 +145,7 @@ class MetadataValidator:
         results = {}
         
         # Check required fields
-        required_fields = ['title', 'abstract', 'doi', 'authors', 'publication_date']
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             results[f'{field}_present'] = field in metadata and bool(metadata.get(field))
         
         # Validate specific field formats
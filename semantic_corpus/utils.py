@@ -1,7 +1,18 @@
 """Utility functions for semantic_corpus."""
 
+import json
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson  # Optional speedup: pip install semantic_corpus[speedups]
+except ImportError:
+    orjson = None
+
+# Strings at least this long are rarely repeated across papers (titles,
+# abstracts), so interning them would only grow the intern table
+_INTERN_MAX_LEN = 64
 
 
 def get_project_temp_dir() -> Path:
@@ -37,3 +48,25 @@ def get_test_results_dir() -> Path:
     return test_dir
 
 
+def loads_json(data: bytes) -> Any:
+    """Decode JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_file(path: Path) -> Any:
+    """Read and decode a JSON file with a single read of its bytes."""
+    return loads_json(Path(path).read_bytes())
+
+
+def intern_short(value: Any) -> Any:
+    """Intern short strings so repeated metadata values share one object.
+
+    Journal names, dates and author names recur across papers in a corpus;
+    interning them keeps one copy in memory. Non-strings and long strings
+    are returned unchanged.
+    """
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
@@ -1,29 +1,183 @@
 """Pytest configuration and fixtures for semantic_corpus tests."""
 
+import contextlib
+import shutil
+import sys
 import pytest
-import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, ContextManager, Dict, Generator, Iterable, List, Optional, Type
+
+from semantic_corpus.core.corpus_manager import CorpusManager
+from semantic_corpus.core.repository_factory import RepositoryFactory
+from semantic_corpus.storage.bagit_manager import BagitManager
+
+# Cassette settings shared by pytest-recording (vcr_config) and the
+# cassettes that session-scoped fixtures open themselves (session_cassette)
+_VCR_CONFIG: Dict[str, Any] = {
+    "record_mode": "new_episodes",
+    "match_on": ["method", "scheme", "host", "path", "query"],
+    "filter_headers": ["authorization"],
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --run-live option."""
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="run tests marked live_api or network (skipped by default)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Skip live tests unless requested, and keep arXiv tests on one xdist worker.
+
+    The arXiv rate limit is enforced by a lock inside each process, so
+    arXiv tests spread over several workers could still hit the API at the
+    same time. Under ``--dist loadgroup`` every ``arxiv`` test runs in one
+    worker; other live tests are spread freely.
+    """
+    if not config.getoption("--run-live"):
+        skip_live = pytest.mark.skip(reason="live API test; pass --run-live to run it")
+        for item in items:
+            if item.get_closest_marker("live_api") or item.get_closest_marker("network"):
+                item.add_marker(skip_live)
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("arxiv") is not None:
+            item.add_marker(pytest.mark.xdist_group(name="arxiv"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repository_cache() -> Generator[None, None, None]:
+    """Share factory-built repositories across the session, then drop them."""
+    yield
+    RepositoryFactory.get_repository.cache_clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_session() -> Generator[None, None, None]:
+    """Close the HTTP connection pool shared by repositories at session end."""
+    yield
+    # Only present if some test created a repository; avoid importing requests otherwise
+    http = sys.modules.get("semantic_corpus.core.http")
+    if http is not None:
+        http.close_session()
+
+
+class FakeResponse:
+    """Stand-in for requests.Response with the parts the repositories use."""
+
+    def __init__(
+        self,
+        content: bytes = b"",
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        chunks: Optional[Iterable[bytes]] = None,
+    ) -> None:
+        """Initialize fake response.
+
+        Args:
+            content: Response body
+            status_code: HTTP status; 400 and above make raise_for_status raise
+            headers: Response headers
+            chunks: Body pieces for iter_content, defaulting to content in one piece
+        """
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.chunks = chunks
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterable[bytes]:
+        return iter([self.content] if self.chunks is None else self.chunks)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+class FakeSession:
+    """Stand-in for the shared requests.Session that answers through a handler.
+
+    Every get() is recorded in requests as a dict of url, params, headers,
+    stream and timeout, then passed to handler as keyword arguments; the
+    handler returns the FakeResponse.
+    """
+
+    def __init__(self, handler: Callable[..., FakeResponse]) -> None:
+        self.handler = handler
+        self.requests: List[Dict[str, Any]] = []
+
+    def get(
+        self,
+        url: str,
+        params: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        request = {"url": url, "params": params, "headers": headers or {}, "stream": stream, "timeout": timeout}
+        self.requests.append(request)
+        return self.handler(**request)
+
+
+@pytest.fixture
+def fake_session() -> Type[FakeSession]:
+    """FakeSession class, for passing to a repository as its session."""
+    return FakeSession
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing in project corpora folder."""
-    # Use project corpora directory for all test files and directories
-    project_corpora = Path(Path(__file__).parent.parent, "corpora")
-    project_corpora.mkdir(parents=True, exist_ok=True)
-    
-    with tempfile.TemporaryDirectory(dir=project_corpora) as tmp_dir:
-        yield Path(tmp_dir)
+def fake_response() -> Type[FakeResponse]:
+    """FakeResponse class, for building FakeSession handler replies."""
+    return FakeResponse
+
+
+@pytest.fixture
+def corpus_manager(tmp_path: Path) -> CorpusManager:
+    """In-memory corpus for tests that only check corpus semantics, not on-disk layout."""
+    return CorpusManager(Path(tmp_path, "corpus"), backend="memory")
+
+
+@pytest.fixture(scope="session")
+def _golden_bag(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Empty bag built once per session as the template for temp_bag."""
+    bag_dir = tmp_path_factory.mktemp("golden_bag")
+    BagitManager(bag_dir).create_bag()
+    return bag_dir
 
 
 @pytest.fixture
+def temp_bag(tmp_path: Path, _golden_bag: Path) -> Path:
+    """Fresh copy of an empty bag, as made by BagitManager.create_bag().
+
+    Files are copied rather than hard-linked, so a test that writes to a
+    bag file in place cannot change the shared template through a link.
+    """
+    bag_dir = Path(tmp_path, "bag")
+    shutil.copytree(_golden_bag, bag_dir)
+    return bag_dir
+
+
+@pytest.fixture(scope="session")
 def sample_pdf_path() -> Path:
     """Return path to sample PDF file for testing."""
     return Path(Path(__file__).parent, "resources", "sample.pdf")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_xml_path() -> Path:
     """Return path to sample XML file for testing."""
     return Path(Path(__file__).parent, "resources", "sample.xml")
@@ -42,3 +196,34 @@ def sample_metadata() -> dict:
         "pmcid": "PMC123456",
         "pmid": "12345678",
     }
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    """Cassette settings for live API tests marked with ``@pytest.mark.vcr``.
+
+    Used by pytest-recording: new requests are appended to the module's
+    cassette, recorded ones are replayed from tests/cassettes/. Override the
+    mode on the command line with ``--record-mode``.
+    """
+    return dict(_VCR_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def session_cassette(pytestconfig: pytest.Config) -> Callable[[str], ContextManager[Any]]:
+    """Open a named cassette around network calls made by session-scoped fixtures.
+
+    pytest-recording's cassettes are function-scoped, so they are not yet
+    open while a session fixture is set up. This records to and replays from
+    tests/cassettes/session/<name>.yaml with the same settings. Without
+    pytest-recording it does nothing, and the calls reach the live APIs.
+    """
+    try:
+        record_mode = pytestconfig.getoption("--record-mode")
+    except ValueError:
+        return lambda name: contextlib.nullcontext()
+    import vcr
+
+    config = dict(_VCR_CONFIG, record_mode=record_mode or _VCR_CONFIG["record_mode"])
+    cassette_dir = Path(Path(__file__).parent, "cassettes", "session")
+    return lambda name: vcr.VCR(**config).use_cassette(str(Path(cassette_dir, f"{name}.yaml")))
@@ -1,5 +1,6 @@
 """Tests for AQI India corpus review workflow."""
 
+import functools
 import json
 import pytest
 from pathlib import Path
@@ -34,6 +35,7 @@ from semantic_corpus.export.chatbot_export import (
 from semantic_corpus.ingestion.pygetpapers_ingester import ingest_pygetpapers_directory
 
 
+@functools.lru_cache(maxsize=1)
 def _wildlife_dir() -> Path:
     repo_root = Path(__file__).resolve().parent.parent
     return Path(
@@ -148,10 +150,10 @@ class TestReviewTable:
         assert all("score" in r and "title" in r for r in rows)
 
     def test_export_review_tables(
-        self, pygetpapers_wildlife_dir: Path, temp_dir: Path
+        self, pygetpapers_wildlife_dir: Path, tmp_path: Path
     ) -> None:
         rows = build_review_rows_from_pygetpapers(pygetpapers_wildlife_dir)
-        paths = export_review_tables(rows, temp_dir, basename="aqi_review")
+        paths = export_review_tables(rows, tmp_path, basename="aqi_review")
         assert paths["json"].is_file(), f"JSON review table missing at {paths['json']}"
         assert paths["csv"].is_file(), f"CSV review table missing at {paths['csv']}"
         assert paths["markdown"].is_file(), (
@@ -160,18 +162,18 @@ class TestReviewTable:
 
 
 class TestQueryRun:
-    def test_query_run_record_roundtrip(self, temp_dir: Path) -> None:
+    def test_query_run_record_roundtrip(self, tmp_path: Path) -> None:
         record = build_query_run_record(
             query_name="aqi_india_pilot",
             query_string="AQI AND India",
             repository="europe_pmc",
             limit=25,
             formats=["xml"],
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             result_count=20,
             downloaded_count=8,
         )
-        path = save_query_run_record(record, temp_dir)
+        path = save_query_run_record(record, tmp_path)
         assert path.is_file(), f"query_run.json should exist at {path}"
         summary = summarize_query_run(record)
         assert "20 results" in summary
@@ -201,7 +203,7 @@ class TestRunQueryAndBuildReviewTable:
         },
     ]
 
-    def test_run_query_and_build_review_table(self, temp_dir: Path) -> None:
+    def test_run_query_and_build_review_table(self, tmp_path: Path) -> None:
         from unittest.mock import patch
 
         from semantic_corpus.corpus_review.workflow import (
@@ -223,7 +225,7 @@ class TestRunQueryAndBuildReviewTable:
             result = run_query_and_build_review_table(
                 query_name="test_query",
                 query_string="AQI AND India",
-                output_dir=temp_dir,
+                output_dir=tmp_path,
                 limit=25,
             )
 
@@ -253,7 +255,7 @@ class TestRunQueryAndBuildReviewTable:
             df = review_rows_to_dataframe(rows)
         assert df is mock_df
 
-    def test_revision_of_recorded(self, temp_dir: Path) -> None:
+    def test_revision_of_recorded(self, tmp_path: Path) -> None:
         from unittest.mock import patch
 
         from semantic_corpus.corpus_review.workflow import (
@@ -267,7 +269,7 @@ class TestRunQueryAndBuildReviewTable:
             result = run_query_and_build_review_table(
                 query_name="test_query_v2",
                 query_string="AQI AND India AND Delhi",
-                output_dir=temp_dir,
+                output_dir=tmp_path,
                 revision_of="test_query",
             )
 
@@ -280,9 +282,9 @@ class TestChatbotExport:
         assert "Sample Article" in label
 
     def test_export_corpus_for_chatbot(
-        self, temp_dir: Path, pygetpapers_wildlife_dir: Path
+        self, tmp_path: Path, pygetpapers_wildlife_dir: Path
     ) -> None:
-        corpus = CorpusManager(temp_dir, use_bagit=True)
+        corpus = CorpusManager(tmp_path, use_bagit=True)
         corpus.create_structured_directories()
         ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
         rows = build_review_rows_from_corpus(corpus)
@@ -291,7 +293,7 @@ class TestChatbotExport:
 
         manifest_path = export_corpus_for_chatbot(
             corpus,
-            Path(temp_dir, "chatbot_export"),
+            Path(tmp_path, "chatbot_export"),
             review_rows=rows,
             include_only_status=True,
         )
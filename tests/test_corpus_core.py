@@ -9,17 +9,17 @@ from semantic_corpus.core.exceptions import CorpusError
 class TestCorpusManager:
     """Test cases for CorpusManager class."""
 
-    def test_corpus_manager_initialization(self, temp_dir: Path):
+    def test_corpus_manager_initialization(self, tmp_path: Path):
         """Test that CorpusManager can be initialized with a valid directory."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
-        assert corpus_manager.corpus_dir == temp_dir, f"Expected corpus_dir to be {temp_dir}, got {corpus_manager.corpus_dir}"
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
+        assert corpus_manager.corpus_dir == tmp_path, f"Expected corpus_dir to be {tmp_path}, got {corpus_manager.corpus_dir}"
         assert corpus_manager.corpus_dir.exists(), "Corpus directory should exist"
 
-    def test_corpus_manager_creates_directory(self, temp_dir: Path):
+    def test_corpus_manager_creates_directory(self, tmp_path: Path):
         """Test that CorpusManager creates the corpus directory if it doesn't exist."""
-        # Create new corpus directory in corpora folder
-        new_dir = Path(temp_dir, "new_corpus")
+        # Create new corpus directory inside the temporary directory
+        new_dir = Path(tmp_path, "new_corpus")
         corpus_manager = CorpusManager(new_dir)
         assert new_dir.exists(), "New corpus directory should be created"
         assert corpus_manager.corpus_dir == new_dir, f"Expected corpus_dir to be {new_dir}, got {corpus_manager.corpus_dir}"
@@ -29,22 +29,22 @@ class TestCorpusManager:
         with pytest.raises(CorpusError):
             CorpusManager(Path("/dev/null/invalid_corpus"))
 
-    def test_add_paper_to_corpus(self, temp_dir: Path, sample_metadata: dict):
+    def test_add_paper_to_corpus(self, tmp_path: Path, sample_metadata: dict):
         """Test adding a paper to the corpus."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
         paper_id = "test_paper_001"
         
         result = corpus_manager.add_paper(paper_id, sample_metadata)
         
         assert result is True, "add_paper should return True"
-        assert Path(temp_dir, "papers", paper_id).exists(), f"Paper directory {paper_id} should exist"
-        assert Path(temp_dir, "papers", paper_id, "metadata.json").exists(), f"Metadata file for {paper_id} should exist"
+        assert Path(tmp_path, "papers", paper_id).exists(), f"Paper directory {paper_id} should exist"
+        assert Path(tmp_path, "papers", paper_id, "metadata.json").exists(), f"Metadata file for {paper_id} should exist"
 
-    def test_get_paper_metadata(self, temp_dir: Path, sample_metadata: dict):
+    def test_get_paper_metadata(self, tmp_path: Path, sample_metadata: dict):
         """Test retrieving paper metadata from corpus."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
         paper_id = "test_paper_002"
         
         # Add paper first
@@ -55,10 +55,10 @@ class TestCorpusManager:
         
         assert retrieved_metadata == sample_metadata, f"Retrieved metadata should match sample metadata, got {retrieved_metadata}"
 
-    def test_list_papers_in_corpus(self, temp_dir: Path, sample_metadata: dict):
+    def test_list_papers_in_corpus(self, tmp_path: Path, sample_metadata: dict):
         """Test listing all papers in the corpus."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
         
         # Add multiple papers
         paper_ids = ["paper_001", "paper_002", "paper_003"]
@@ -72,10 +72,10 @@ class TestCorpusManager:
         for paper_id in paper_ids:
             assert paper_id in papers, f"Paper {paper_id} should be in papers list"
 
-    def test_search_papers_by_title(self, temp_dir: Path):
+    def test_search_papers_by_title(self, tmp_path: Path):
         """Test searching papers by title."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
         
         # Add papers with different titles
         papers = [
@@ -95,15 +95,29 @@ class TestCorpusManager:
         assert "paper_003" in results, "paper_003 should be in search results"
         assert "paper_002" not in results, "paper_002 should not be in search results (doesn't contain 'climate')"
 
-    def test_corpus_statistics(self, temp_dir: Path, sample_metadata: dict):
+    def test_search_papers_sees_updated_metadata(self, tmp_path: Path):
+        """Test that repeated searches reflect papers added or rewritten in between."""
+        corpus_manager = CorpusManager(tmp_path)
+        corpus_manager.add_paper("paper_001", {"title": "Climate Change and Adaptation"})
+        
+        assert corpus_manager.search_papers("climate") == ["paper_001"], "paper_001 should match 'climate'"
+        
+        corpus_manager.add_paper("paper_001", {"title": "Machine Learning Applications"})
+        corpus_manager.add_paper("paper_002", {"title": "Climate Change Mitigation"})
+        
+        results = corpus_manager.search_papers("climate")
+        assert results == ["paper_002"], f"Only the new paper_002 title mentions climate, got {results}"
+
+    def test_corpus_statistics(self, tmp_path: Path, sample_metadata: dict):
         """Test getting corpus statistics."""
-        # Create corpus in corpora directory
-        corpus_manager = CorpusManager(temp_dir)
+        # Create corpus in a temporary directory
+        corpus_manager = CorpusManager(tmp_path)
         
-        # Add some papers
-        for i in range(5):
-            paper_id = f"paper_{i:03d}"
-            corpus_manager.add_paper(paper_id, sample_metadata)
+        # Add some papers in one batch
+        added = corpus_manager.add_papers_bulk(
+            {f"paper_{i:03d}": sample_metadata for i in range(5)}
+        )
+        assert len(added) == 5, f"Expected 5 papers added, got {len(added)}"
         
         stats = corpus_manager.get_statistics()
         
@@ -111,3 +125,26 @@ class TestCorpusManager:
         assert stats["corpus_size_mb"] > 0, f"Expected corpus_size_mb > 0, got {stats.get('corpus_size_mb')}"
         assert "creation_date" in stats, "Statistics should contain 'creation_date'"
         assert "last_updated" in stats, "Statistics should contain 'last_updated'"
+
+    def test_memory_backend(self, tmp_path: Path, sample_metadata: dict):
+        """Test that the memory backend round-trips papers without touching disk."""
+        corpus_dir = Path(tmp_path, "memory_corpus")
+        corpus_manager = CorpusManager(corpus_dir, backend="memory")
+        
+        corpus_manager.add_paper("paper_001", sample_metadata)
+        corpus_manager.add_paper("paper_002", {"title": "Machine Learning Applications"})
+        
+        assert not corpus_dir.exists(), "Memory backend should not create the corpus directory"
+        assert corpus_manager.get_paper_metadata("paper_001") == sample_metadata, "Retrieved metadata should match sample metadata"
+        assert sorted(corpus_manager.list_papers()) == ["paper_001", "paper_002"], "Both papers should be listed"
+        assert corpus_manager.search_papers("sample", field="title") == ["paper_001"], "Only paper_001 has 'sample' in its title"
+        stats = corpus_manager.get_statistics()
+        assert stats["total_papers"] == 2, f"Expected 2 papers, got {stats.get('total_papers')}"
+        assert stats["corpus_size_mb"] > 0, f"Expected corpus_size_mb > 0, got {stats.get('corpus_size_mb')}"
+        with pytest.raises(CorpusError):
+            corpus_manager.get_paper_metadata("missing_paper")
+
+    def test_memory_backend_rejects_bagit(self, tmp_path: Path):
+        """Test that BAGIT corpora require the filesystem backend."""
+        with pytest.raises(CorpusError):
+            CorpusManager(tmp_path, use_bagit=True, backend="memory")
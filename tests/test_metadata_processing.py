@@ -61,6 +61,41 @@ class TestMetadataProcessor:
         assert normalized["authors"] == ["Author 1", "Author 2"], f"Expected normalized authors ['Author 1', 'Author 2'], got '{normalized.get('authors')}'"
         assert normalized["publication_date"] == "2024-01-01", f"Expected normalized publication_date '2024-01-01', got '{normalized.get('publication_date')}'"
 
+    def test_normalize_metadata_aliases(self):
+        """Test normalizing Europe PMC style field names and unknown keys."""
+        processor = MetadataProcessor()
+
+        raw_metadata = {
+            "AbstractText": "Sample abstract text",
+            "AuthorList": ["Author 1"],
+            "firstPublicationDate": "2024-01-01",
+            "journalTitle": "Sample Journal",
+            "Publication Date": "2024-02-02",
+            "PMCID": "PMC123",
+        }
+
+        normalized = processor.normalize_metadata(raw_metadata)
+
+        assert normalized["abstract"] == "Sample abstract text", f"Expected abstract from AbstractText, got '{normalized.get('abstract')}'"
+        assert normalized["authors"] == ["Author 1"], f"Expected authors from AuthorList, got '{normalized.get('authors')}'"
+        assert normalized["journal"] == "Sample Journal", f"Expected journal from journalTitle, got '{normalized.get('journal')}'"
+        assert normalized["publication_date"] == "2024-02-02", f"Expected spaced key to map to publication_date, got '{normalized.get('publication_date')}'"
+        assert normalized["pmcid"] == "PMC123", f"Expected unknown key to be lowercased, got keys {list(normalized)}"
+
+    def test_normalize_metadata_interns_short_values(self):
+        """Test that repeated short values share one string object."""
+        import sys
+
+        processor = MetadataProcessor()
+        long_title = "T" * 100
+
+        first = processor.normalize_metadata({"journal": "".join(["Sample ", "Journal"]), "title": long_title})
+        second = processor.normalize_metadata({"journal": "".join(["Sample ", "Journal"]), "authors": ["".join(["Author ", "1"])]})
+
+        assert first["journal"] is second["journal"], "Expected repeated journal names to be interned"
+        assert second["authors"][0] is sys.intern("Author 1"), f"Expected author names to be interned, got {second['authors']}"
+        assert first["title"] is long_title, "Expected long values to be left untouched"
+
     def test_validate_metadata(self):
         """Test validating metadata."""
         processor = MetadataProcessor()
@@ -143,6 +178,19 @@ class TestMetadataExtractor:
         assert metadata["doi"] == "10.1000/sample", f"Expected doi '10.1000/sample', got '{metadata.get('doi')}'"
         assert metadata["authors"] == ["Author 1", "Author 2"], f"Expected authors ['Author 1', 'Author 2'], got '{metadata.get('authors')}'"
 
+    def test_extract_from_json_without_orjson(self, monkeypatch):
+        """Test that JSON extraction falls back to the stdlib decoder."""
+        import semantic_corpus.utils as utils
+        
+        monkeypatch.setattr(utils, "orjson", None)
+        extractor = MetadataExtractor()
+        json_path = Path(Path(__file__).parent, "resources", "sample.json")
+        
+        metadata = extractor.extract_from_json(json_path)
+        
+        assert metadata["title"] == "Sample Article", f"Expected title 'Sample Article', got '{metadata.get('title')}'"
+        assert metadata["authors"] == ["Author 1", "Author 2"], f"Expected authors ['Author 1', 'Author 2'], got '{metadata.get('authors')}'"
+
     def test_extract_raises_error_for_unsupported_format(self):
         """Test that extractor raises error for unsupported file formats."""
         extractor = MetadataExtractor()
@@ -188,10 +236,12 @@ class TestMetadataValidation:
         # Test valid dates
         assert validator.validate_publication_date("2024-01-01") is True, "Valid date '2024-01-01' should return True"
         assert validator.validate_publication_date("2023-12-31") is True, "Valid date '2023-12-31' should return True"
+        assert validator.validate_publication_date("2024-1-5") is True, "Unpadded date '2024-1-5' should return True"
         
         # Test invalid dates
         assert validator.validate_publication_date("invalid-date") is False, "Invalid date 'invalid-date' should return False"
         assert validator.validate_publication_date("2024-13-01") is False, "Invalid date '2024-13-01' (invalid month) should return False"
+        assert validator.validate_publication_date("2023-02-29") is False, "Invalid date '2023-02-29' (not a leap year) should return False"
         assert validator.validate_publication_date("") is False, "Empty date should return False"
 
     def test_validate_required_fields(self):
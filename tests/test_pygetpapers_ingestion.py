@@ -8,8 +8,11 @@ Test data: ../amilib/test/resources/pygetpapers/wildlife/
   path resolves. If the wildlife directory is missing, ingestion tests are skipped.
 """
 
+import functools
+import json
 import pytest
 from pathlib import Path
+from typing import List, Tuple
 
 from semantic_corpus.core.corpus_manager import CorpusManager
 from semantic_corpus.core.exceptions import CorpusError
@@ -20,6 +23,7 @@ from semantic_corpus.ingestion.pygetpapers_ingester import (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def _wildlife_dir() -> Path:
     """Path to amilib pygetpapers wildlife fixture (sibling repo)."""
     # semantic_corpus repo root is parent of tests/
@@ -27,7 +31,7 @@ def _wildlife_dir() -> Path:
     return Path(repo_root, "..", "amilib", "test", "resources", "pygetpapers", "wildlife").resolve()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pygetpapers_wildlife_dir() -> Path:
     """Path to ../amilib/test/resources/pygetpapers/wildlife/. Skips if missing."""
     path = _wildlife_dir()
@@ -39,16 +43,28 @@ def pygetpapers_wildlife_dir() -> Path:
     return path
 
 
+@pytest.fixture(scope="module")
+def ingested_wildlife_corpus(
+    tmp_path_factory: pytest.TempPathFactory, pygetpapers_wildlife_dir: Path
+) -> Tuple[CorpusManager, List[str]]:
+    """BAGIT corpus with the wildlife directory ingested once per module, plus the added IDs.
+
+    Shared by several tests, so treat it as read-only.
+    """
+    corpus = CorpusManager(tmp_path_factory.mktemp("wildlife_corpus"), use_bagit=True)
+    corpus.create_structured_directories()
+    added = ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
+    return corpus, added
+
+
 class TestPygetpapersIngestion:
     """Ingest pygetpapers wildlife directory into a BAGIT corpus."""
 
     def test_ingest_wildlife_adds_all_papers(
-        self, temp_dir: Path, pygetpapers_wildlife_dir: Path
+        self, ingested_wildlife_corpus: Tuple[CorpusManager, List[str]]
     ) -> None:
         """Ingesting wildlife dir adds one corpus paper per PMC folder."""
-        corpus = CorpusManager(temp_dir, use_bagit=True)
-        corpus.create_structured_directories()
-        added = ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
+        corpus, added = ingested_wildlife_corpus
         papers = corpus.list_papers()
         assert len(added) >= 9, (
             f"Expected at least 9 papers added from wildlife dir, got {len(added)}"
@@ -60,12 +76,10 @@ class TestPygetpapersIngestion:
             assert pid in papers, f"Added paper {pid} should be in list_papers()"
 
     def test_ingest_wildlife_metadata_and_xml_present(
-        self, temp_dir: Path, pygetpapers_wildlife_dir: Path
+        self, ingested_wildlife_corpus: Tuple[CorpusManager, List[str]]
     ) -> None:
         """After ingest, metadata and XML files are present for a known paper."""
-        corpus = CorpusManager(temp_dir, use_bagit=True)
-        corpus.create_structured_directories()
-        ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
+        corpus, _ = ingested_wildlife_corpus
         paper_id = "europe_pmc_PMC12124168"
         metadata = corpus.get_paper_metadata(paper_id)
         assert metadata.get("title"), (
@@ -80,7 +94,7 @@ class TestPygetpapersIngestion:
         assert metadata.get("doi") == "10.1111/cobi.70049", (
             f"DOI for {paper_id} should match source"
         )
-        xml_path = Path(temp_dir, "data", "documents", "xml", f"{paper_id}.xml")
+        xml_path = Path(corpus.corpus_dir, "data", "documents", "xml", f"{paper_id}.xml")
         assert xml_path.exists(), (
             f"XML file should exist at {xml_path} after ingest"
         )
@@ -89,12 +103,10 @@ class TestPygetpapersIngestion:
         )
 
     def test_ingest_wildlife_search_after_ingest(
-        self, temp_dir: Path, pygetpapers_wildlife_dir: Path
+        self, ingested_wildlife_corpus: Tuple[CorpusManager, List[str]]
     ) -> None:
         """Search by title returns expected paper after ingest."""
-        corpus = CorpusManager(temp_dir, use_bagit=True)
-        corpus.create_structured_directories()
-        ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
+        corpus, _ = ingested_wildlife_corpus
         results = corpus.search_papers("wildlife", field="title")
         assert len(results) >= 1, (
             f"Search for 'wildlife' in title should return at least one paper, got {results}"
@@ -104,20 +116,96 @@ class TestPygetpapersIngestion:
             f"Search for 'conservation' in abstract should return at least one paper, got {results_abstract}"
         )
 
-    def test_ingest_nonexistent_dir_raises(self, temp_dir: Path) -> None:
+    def test_ingest_nonexistent_dir_raises(self, tmp_path: Path) -> None:
         """Passing a non-existent directory raises CorpusError."""
-        corpus = CorpusManager(temp_dir, use_bagit=True)
+        corpus = CorpusManager(tmp_path, use_bagit=True)
         corpus.create_structured_directories()
-        bad_path = Path(temp_dir, "does", "not", "exist")
+        bad_path = Path(tmp_path, "does", "not", "exist")
         with pytest.raises(CorpusError) as exc_info:
             ingest_pygetpapers_directory(bad_path, corpus)
         assert "does not exist" in str(exc_info.value), (
             "Error message should mention directory does not exist"
         )
 
-    def test_ingest_requires_bagit(self, temp_dir: Path, pygetpapers_wildlife_dir: Path) -> None:
+    def test_ingest_synthetic_directory(self, tmp_path: Path) -> None:
+        """Ingest returns IDs in folder order and copies each full text."""
+        source = Path(tmp_path, "pygetpapers")
+        for pmcid in ("PMC3", "PMC1", "PMC2"):
+            folder = Path(source, pmcid)
+            folder.mkdir(parents=True)
+            Path(folder, "eupmc_result.json").write_text(
+                json.dumps({"title": f"Title {pmcid}", "pmcid": pmcid}), encoding="utf-8"
+            )
+            Path(folder, "fulltext.xml").write_text(f"<article>{pmcid}</article>", encoding="utf-8")
+        corpus = CorpusManager(Path(tmp_path, "corpus"), use_bagit=True)
+        corpus.create_structured_directories()
+
+        added = ingest_pygetpapers_directory(source, corpus)
+
+        expected = ["europe_pmc_PMC1", "europe_pmc_PMC2", "europe_pmc_PMC3"]
+        assert added == expected, f"Expected IDs in folder order {expected}, got {added}"
+        for paper_id in expected:
+            xml_path = Path(corpus.corpus_dir, "data", "documents", "xml", f"{paper_id}.xml")
+            assert xml_path.exists(), f"XML file should exist at {xml_path} after ingest"
+        assert corpus.bagit_manager.validate_bag(), "Bag should be valid after ingest"
+
+    def test_ingest_continues_past_bad_folder(self, tmp_path: Path) -> None:
+        """A folder with unreadable JSON is reported after the others are ingested."""
+        source = Path(tmp_path, "pygetpapers")
+        for pmcid in ("PMC1", "PMC2", "PMC3"):
+            folder = Path(source, pmcid)
+            folder.mkdir(parents=True)
+            body = "{not json" if pmcid == "PMC2" else json.dumps({"title": f"Title {pmcid}", "pmcid": pmcid})
+            Path(folder, "eupmc_result.json").write_text(body, encoding="utf-8")
+        corpus = CorpusManager(Path(tmp_path, "corpus"), use_bagit=True)
+        corpus.create_structured_directories()
+
+        with pytest.raises(CorpusError) as exc_info:
+            ingest_pygetpapers_directory(source, corpus)
+
+        assert "PMC2" in str(exc_info.value), f"Error should name the bad folder, got {exc_info.value}"
+        assert sorted(corpus.list_papers()) == ["europe_pmc_PMC1", "europe_pmc_PMC3"], (
+            f"Good folders should still be ingested, got {corpus.list_papers()}"
+        )
+        assert corpus.bagit_manager.validate_bag(), "Bag should be valid after a partial ingest"
+
+    def test_ingest_failed_folder_leaves_no_payload(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Failing folders leave no copied full texts, whatever they raise."""
+        from semantic_corpus.tools.metadata_processor import MetadataProcessor
+
+        source = Path(tmp_path, "pygetpapers")
+        for pmcid in ("PMC1", "PMC2", "PMC3"):
+            folder = Path(source, pmcid)
+            folder.mkdir(parents=True)
+            Path(folder, "eupmc_result.json").write_text(
+                json.dumps({"title": f"Title {pmcid}", "pmcid": pmcid}), encoding="utf-8"
+            )
+            Path(folder, "fulltext.xml").write_text(f"<article>{pmcid}</article>", encoding="utf-8")
+        # PMC2's PDF copy fails after its XML has been copied
+        Path(source, "PMC2", "fulltext.pdf").mkdir()
+        normalize = MetadataProcessor.normalize_metadata
+        def failing_normalize(self, raw):
+            if raw["pmcid"] == "PMC3":
+                raise TypeError("unexpected metadata")
+            return normalize(self, raw)
+        monkeypatch.setattr(MetadataProcessor, "normalize_metadata", failing_normalize)
+        corpus = CorpusManager(Path(tmp_path, "corpus"), use_bagit=True)
+        corpus.create_structured_directories()
+
+        with pytest.raises(CorpusError) as exc_info:
+            ingest_pygetpapers_directory(source, corpus)
+
+        assert "PMC2" in str(exc_info.value) and "PMC3" in str(exc_info.value), (
+            f"Error should name both bad folders, got {exc_info.value}"
+        )
+        assert corpus.list_papers() == ["europe_pmc_PMC1"], f"Good folder should be ingested, got {corpus.list_papers()}"
+        xml_files = sorted(p.name for p in Path(corpus.corpus_dir, "data", "documents", "xml").iterdir())
+        assert xml_files == ["europe_pmc_PMC1.xml"], f"Failed folders should leave no full texts, got {xml_files}"
+        assert corpus.bagit_manager.validate_bag(), "Bag should be valid after a partial ingest"
+
+    def test_ingest_requires_bagit(self, tmp_path: Path, pygetpapers_wildlife_dir: Path) -> None:
         """Ingestion requires BAGIT corpus; non-BAGIT raises CorpusError."""
-        corpus = CorpusManager(temp_dir, use_bagit=False)
+        corpus = CorpusManager(tmp_path, use_bagit=False)
         with pytest.raises(CorpusError) as exc_info:
             ingest_pygetpapers_directory(pygetpapers_wildlife_dir, corpus)
         assert "BAGIT" in str(exc_info.value), (
@@ -156,3 +244,11 @@ class TestPygetpapersIngestionHelpers:
         assert raw["authors"] == ["Author A", "Author B"]
         assert raw["publication_date"] == "2025-01-15"
         assert raw["journal"] == "Test Journal"
+
+    def test_eupmc_author_string_variants(self) -> None:
+        """Author strings with stray spaces, dots and empty entries split cleanly."""
+        raw = _eupmc_json_to_raw_metadata({"authorString": " Smith J. ,Doe A,, Lee K . "})
+        assert raw["authors"] == ["Smith J", "Doe A", "Lee K"], (
+            f"Unexpected author split: {raw['authors']}"
+        )
+        assert _eupmc_json_to_raw_metadata({})["authors"] == [], "Missing authorString gives no authors"
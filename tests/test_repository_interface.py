@@ -1,11 +1,17 @@
 """Tests for repository interface functionality."""
 
+import json
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from types import SimpleNamespace
 from semantic_corpus.core.repository_interface import RepositoryInterface
 from semantic_corpus.core.exceptions import RepositoryError
-from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
-from semantic_corpus.repositories.arxiv import ArxivRepository
 
 
 class TestRepositoryInterface:
@@ -24,20 +30,185 @@ class TestRepositoryInterface:
         assert hasattr(RepositoryInterface, 'get_paper_metadata'), "RepositoryInterface should have 'get_paper_metadata' method"
         assert hasattr(RepositoryInterface, 'get_repository_info'), "RepositoryInterface should have 'get_repository_info' method"
 
+    def test_download_papers_runs_concurrently(self, tmp_path: Path):
+        """Test that download_papers overlaps downloads and keeps per-paper results."""
+
+        class SlowRepository(RepositoryInterface):
+            def __init__(self) -> None:
+                super().__init__()
+                self.barrier = threading.Barrier(3, timeout=5)
+
+            def search_papers(self, query, limit=100, start_date=None, end_date=None, **kwargs):
+                return []
+
+            def get_paper_metadata(self, paper_id):
+                return {}
+
+            def download_paper(self, paper_id, output_dir, formats=None):
+                # Only returns if all three downloads are in flight at once
+                self.barrier.wait()
+                if paper_id == "bad":
+                    raise RepositoryError(f"Failed to download {paper_id}")
+                if paper_id == "odd":
+                    raise ValueError(f"Unexpected response for {paper_id}")
+                return {"success": True, "paper_id": paper_id, "files": []}
+
+            def get_repository_info(self):
+                return {}
+
+        results = SlowRepository().download_papers(["a", "bad", "a", "odd"], tmp_path)
+
+        assert list(results) == ["a", "bad", "odd"], f"Results should keep first-seen order without repeats, got {list(results)}"
+        assert results["a"]["success"] is True, f"Expected success for 'a', got {results['a']}"
+        assert results["bad"]["success"] is False, f"Expected failure for 'bad', got {results['bad']}"
+        assert "bad" in results["bad"]["error"], f"Error should be reported, got {results['bad']}"
+        assert results["odd"]["success"] is False, f"Any exception should be a per-paper failure, got {results['odd']}"
+
 
 class TestEuropePMCRepository:
     """Test cases for Europe PMC repository implementation."""
 
     def test_europe_pmc_initialization(self):
         """Test that Europe PMC repository can be initialized."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        
         repo = EuropePMCRepository()
         assert repo.name == "Europe PMC", f"Expected name 'Europe PMC', got '{repo.name}'"
         assert repo.base_url == "https://www.ebi.ac.uk/europepmc/webservices/rest", f"Expected base_url 'https://www.ebi.ac.uk/europepmc/webservices/rest', got '{repo.base_url}'"
 
+    def test_europe_pmc_download_reports_failed_formats(self, tmp_path: Path, fake_session, fake_response):
+        """Test that formats that arrive are kept when another format fails."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+
+        def respond(url, **kwargs):
+            return fake_response(b"<article/>", status_code=404 if url.endswith("fullTextPDF") else 200)
+
+        repo = EuropePMCRepository(session=fake_session(respond))
+        result = repo.download_paper("PMC1", tmp_path, formats=["xml", "pdf"])
+
+        assert result["success"] is False, f"A missing format should mark the download unsuccessful, got {result}"
+        assert result["files"] == [str(tmp_path / "PMC1.xml")], f"The XML should be kept, got {result['files']}"
+        assert result["error"].startswith("pdf:"), f"The failed format should be reported, got {result['error']}"
+
+        with pytest.raises(RepositoryError):
+            repo.download_paper("PMC2", tmp_path, formats=["pdf"])
+
+    def test_europe_pmc_download_streams_to_disk(self, tmp_path: Path, fake_session, fake_response):
+        """Test that a large download is written in chunks, not held in memory."""
+        import requests
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+
+        chunk = b"%PDF" + b"x" * (1024 * 1024 - 4)
+        chunks = 16
+        failing = []
+
+        def body():
+            for n in range(chunks):
+                if failing and n == 3:
+                    raise requests.ConnectionError("connection reset")
+                yield bytes(chunk)
+
+        session = fake_session(lambda **kwargs: fake_response(chunks=body()))
+        repo = EuropePMCRepository(session=session)
+        tracemalloc.start()
+        try:
+            result = repo.download_paper("PMC1", tmp_path, formats=["pdf"])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        pdf = tmp_path / "PMC1.pdf"
+        assert result["files"] == [str(pdf)], f"Unexpected files {result['files']}"
+        assert pdf.stat().st_size == chunks * len(chunk), f"Expected {chunks} MiB on disk, got {pdf.stat().st_size} bytes"
+        assert peak < 4 * 1024 * 1024, f"Peak allocation {peak} bytes suggests the body was buffered"
+        assert all(request["stream"] for request in session.requests), "Full-text downloads should be streamed"
+        assert all(request["timeout"] for request in session.requests), "Streamed downloads should have a timeout"
+
+        failing.append(True)
+        with pytest.raises(RepositoryError):
+            repo.download_paper("PMC2", tmp_path, formats=["pdf"])
+        assert not (tmp_path / "PMC2.pdf").exists(), "A failed transfer should not leave a partial file"
+
+    def test_europe_pmc_uses_orjson_when_available(self, monkeypatch: pytest.MonkeyPatch, fake_session, fake_response):
+        """Test that search responses are decoded with orjson and bad JSON is a RepositoryError."""
+        orjson = pytest.importorskip("orjson")
+        from semantic_corpus import utils
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+
+        calls = []
+        def counting_loads(data):
+            calls.append(len(data))
+            return orjson.loads(data)
+        monkeypatch.setattr(utils, "orjson", SimpleNamespace(loads=counting_loads))
+
+        bodies = [b'{"resultList": {"result": [{"pmcid": "PMC1", "title": "Paper"}]}}', b"<html>busy</html>"]
+        repo = EuropePMCRepository(session=fake_session(lambda **kwargs: fake_response(bodies.pop(0))))
+        results = repo.search_papers("climate", limit=5)
+        assert [r["pmcid"] for r in results] == ["PMC1"], f"Unexpected results {results}"
+        assert len(calls) == 1, f"Expected orjson.loads to decode the response once, got {len(calls)} calls"
+
+        with pytest.raises(RepositoryError):
+            repo.search_papers("climate", limit=5)
+
+    def test_metadata_cache_hit(self, tmp_path: Path, fake_session, fake_response):
+        """Test that cached metadata skips the network and revalidates with its ETag."""
+        from semantic_corpus.core.metadata_cache import MetadataCache
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+
+        body = json.dumps({"resultList": {"result": [{"pmid": "40964903", "title": "Cached paper"}]}}).encode()
+
+        def respond(headers, **kwargs):
+            if headers.get("If-None-Match") == '"v1"':
+                return fake_response(status_code=304, headers={"ETag": '"v1"'})
+            return fake_response(body, headers={"ETag": '"v1"'})
+
+        session = fake_session(respond)
+        cache = MetadataCache(tmp_path / "metadata.sqlite")
+        repo = EuropePMCRepository(session=session, cache=cache)
+
+        first = repo.get_paper_metadata("40964903")
+        second = repo.get_paper_metadata("40964903")
+
+        assert first == second and first["title"] == "Cached paper", f"Unexpected metadata {first} / {second}"
+        assert len(session.requests) == 1, f"Second call should be served from the cache, got {len(session.requests)} requests"
+        assert cache.contains("europe_pmc:40964903"), "Response should be cached"
+
+        # A stale entry is revalidated and a 304 reuses the cached body
+        cache.expire_after = 0
+        cache.refresh("europe_pmc:40964903", {})
+        third = repo.get_paper_metadata("40964903")
+        assert third == first, f"304 should reuse the cached body, got {third}"
+        assert session.requests[-1]["headers"] == {"If-None-Match": '"v1"'}, f"Expected a conditional request, got {session.requests[-1]}"
+
+    def test_europe_pmc_batch_download(self, tmp_path: Path, fake_session, fake_response):
+        """Test that a batch download fetches papers and their formats concurrently."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+
+        paper_ids = [f"PMC{n}" for n in range(1, 6)]
+        # Only releases once every paper's XML and PDF request is in flight
+        barrier = threading.Barrier(2 * len(paper_ids), timeout=5)
+
+        def respond(url, **kwargs):
+            barrier.wait()
+            return fake_response(url.encode())
+
+        repo = EuropePMCRepository(session=fake_session(respond))
+        results = repo.download_papers(paper_ids, tmp_path, formats=["xml", "pdf"], max_workers=len(paper_ids))
+
+        assert list(results) == paper_ids, f"Results should keep input order, got {list(results)}"
+        for paper_id in paper_ids:
+            result = results[paper_id]
+            assert result["success"] is True, f"Expected success for {paper_id}, got {result}"
+            assert result["files"] == [str(tmp_path / f"{paper_id}.xml"), str(tmp_path / f"{paper_id}.pdf")], f"Unexpected files for {paper_id}: {result['files']}"
+        assert (tmp_path / "PMC3.pdf").read_bytes().endswith(b"/PMC3/fullTextPDF"), "PDF should come from the fullTextPDF endpoint"
+
     @pytest.mark.live_api
     @pytest.mark.network
+    @pytest.mark.vcr
     def test_europe_pmc_search_papers(self):
         """Test searching papers in Europe PMC with live API."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        
         repo = EuropePMCRepository()
         
         # Use live API with a simple, reliable query
@@ -60,8 +231,11 @@ class TestEuropePMCRepository:
 
     @pytest.mark.live_api
     @pytest.mark.network
+    @pytest.mark.vcr
     def test_europe_pmc_get_paper_metadata(self):
         """Test getting paper metadata from Europe PMC with live API."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        
         repo = EuropePMCRepository()
         
         # Use a known working paper ID
@@ -81,17 +255,20 @@ class TestEuropePMCRepository:
 
     @pytest.mark.live_api
     @pytest.mark.network
-    def test_europe_pmc_download_paper(self, temp_dir: Path):
+    @pytest.mark.vcr
+    def test_europe_pmc_download_paper(self, tmp_path: Path):
         """Test downloading a paper from Europe PMC with live API."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        
         repo = EuropePMCRepository()
         
         # Use a known working paper ID
         paper_id = "40964903"  # PMID that we know works
         
-        # Test downloading the real paper to corpora directory
+        # Test downloading the real paper to a temporary directory
         result = repo.download_paper(
             paper_id=paper_id,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             formats=["xml"]  # Start with XML only for faster testing
         )
         
@@ -101,8 +278,8 @@ class TestEuropePMCRepository:
         
         # Verify files were actually downloaded
         for file_path in result["files"]:
-            assert Path(file_path).exists(), f"Downloaded file {file_path} should exist"
-            assert Path(file_path).stat().st_size > 0, f"Downloaded file {file_path} should not be empty"
+            # stat() raises for a missing file, so one call checks both
+            assert Path(file_path).stat().st_size > 0, f"Downloaded file {file_path} should exist and not be empty"
 
 
 class TestArxivRepository:
@@ -110,15 +287,180 @@ class TestArxivRepository:
 
     def test_arxiv_initialization(self):
         """Test that arXiv repository can be initialized."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
         repo = ArxivRepository()
         assert repo.name == "arXiv", f"Expected name 'arXiv', got '{repo.name}'"
         assert repo.base_url == "http://export.arxiv.org/api/query", f"Expected base_url 'http://export.arxiv.org/api/query', got '{repo.base_url}'"
 
+    def test_arxiv_parses_feed_offline(self, monkeypatch: pytest.MonkeyPatch):
+        """Test parsing an arXiv Atom feed and its error entries without the network."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
+        feed = Path(Path(__file__).parent, "resources", "arxiv_feed.xml").read_bytes()
+        error_feed = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            b'<id>http://arxiv.org/api/errors#incorrect_id_format_for_9999.9999</id>'
+            b'<title>Error</title><summary>incorrect id format for 9999.9999</summary>'
+            b'</entry></feed>'
+        )
+        repo = ArxivRepository()
+        responses = {"climate": feed, "9999.9999": error_feed}
+        monkeypatch.setattr(
+            repo,
+            "_make_request",
+            lambda params: SimpleNamespace(
+                content=responses[params.get("search_query") or params.get("id_list")]
+            ),
+        )
+        
+        papers = repo.search_papers("climate", limit=10)
+        
+        assert len(papers) == 2, f"Expected 2 papers from the feed, got {len(papers)}"
+        first = papers[0]
+        assert first["arxiv_id"] == "2301.00001v1", f"Expected arxiv_id '2301.00001v1', got '{first['arxiv_id']}'"
+        assert first["title"] == "Climate models and machine learning", f"Unexpected title '{first['title']}'"
+        assert first["authors"] == [{"name": "Ada Lovelace"}, {"name": "Alan Turing"}], f"Unexpected authors {first['authors']}"
+        assert first["publication_date"] == "2023-01-01T00:00:00Z", f"Unexpected publication_date '{first['publication_date']}'"
+        assert first["categories"] == ["cs.LG"], f"Unexpected categories {first['categories']}"
+        
+        with pytest.raises(RepositoryError):
+            repo.get_paper_metadata("9999.9999")
+
+    def test_arxiv_batch_metadata(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that several IDs are fetched with one id_list request and matched back."""
+        from semantic_corpus.repositories import arxiv as arxiv_module
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
+        feed = Path(Path(__file__).parent, "resources", "arxiv_feed.xml").read_bytes()
+        requests_made = []
+        repo = ArxivRepository()
+        def fake_request(params):
+            requests_made.append(params)
+            return SimpleNamespace(content=feed)
+        monkeypatch.setattr(repo, "_make_request", fake_request)
+        
+        ids = ["2301.00001", "2301.00002v2", "2301.99999"]
+        metadata = repo.get_papers_metadata(ids)
+        
+        assert len(requests_made) == 1, f"Expected a single request, got {len(requests_made)}"
+        assert requests_made[0]["id_list"] == ",".join(ids), f"Unexpected id_list {requests_made[0]['id_list']}"
+        assert sorted(metadata) == ["2301.00001", "2301.00002v2"], f"Expected the two IDs in the feed, got {sorted(metadata)}"
+        assert metadata["2301.00001"]["arxiv_id"] == "2301.00001v1", f"Unexpected match {metadata['2301.00001']['arxiv_id']}"
+        with pytest.raises(RepositoryError):
+            repo.get_paper_metadata("2301.99999")
+        
+        requests_made.clear()
+        monkeypatch.setattr(arxiv_module, "_ID_LIST_BATCH_SIZE", 2)
+        repo.get_papers_metadata(ids)
+        assert [p["id_list"] for p in requests_made] == ["2301.00001,2301.00002v2", "2301.99999"], f"Unexpected batches {requests_made}"
+
+    def test_arxiv_parse_streaming(self):
+        """Test streaming a large feed, honouring limit and rejecting bad XML."""
+        from lxml import etree
+        from semantic_corpus.repositories.arxiv import _parse_feed
+
+        entries = "".join(
+            f'<entry><id>http://arxiv.org/abs/2301.{n:05d}v1</id><title>Paper {n}</title>'
+            f'<summary>Abstract {n}</summary><published>2023-01-01T00:00:00Z</published>'
+            f'<author><name>Author {n}</name></author>'
+            f'<arxiv:primary_category term="cs.LG"/></entry>'
+            for n in range(500)
+        )
+        feed = (
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+            f'<title>query</title>{entries}</feed>'
+        ).encode()
+
+        papers = _parse_feed(feed)
+        assert len(papers) == 500, f"Expected 500 papers, got {len(papers)}"
+        assert papers[-1]["arxiv_id"] == "2301.00499v1", f"Unexpected last arxiv_id '{papers[-1]['arxiv_id']}'"
+        assert papers[-1]["authors"] == [{"name": "Author 499"}], f"Unexpected authors {papers[-1]['authors']}"
+        assert papers[-1]["categories"] == ["cs.LG"], f"Unexpected categories {papers[-1]['categories']}"
+
+        limited = _parse_feed(feed, limit=3)
+        assert [p["title"] for p in limited] == ["Paper 0", "Paper 1", "Paper 2"], f"Unexpected limited titles {limited}"
+
+        with pytest.raises(etree.XMLSyntaxError):
+            _parse_feed(feed[:-20])
+
+    def test_arxiv_retries_throttled_requests(self, fake_session, fake_response):
+        """Test that 429/503 responses are retried and other errors are not."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+
+        feed = Path(Path(__file__).parent, "resources", "arxiv_feed.xml").read_bytes()
+
+        def replying(*statuses):
+            remaining = list(statuses)
+            return fake_session(
+                lambda **kwargs: fake_response(feed, status_code=remaining.pop(0), headers={"Retry-After": "0"})
+            )
+
+        throttled = replying(429, 503, 200)
+        repo = ArxivRepository(session=throttled)
+        repo.min_request_interval = 0
+        papers = repo.search_papers("climate", limit=10)
+        assert len(papers) == 2, f"Expected the feed after retries, got {len(papers)} papers"
+        assert len(throttled.requests) == 3, f"Expected 3 attempts, got {len(throttled.requests)}"
+
+        exhausted = replying(*[429] * 10)
+        repo = ArxivRepository(session=exhausted)
+        repo.min_request_interval = 0
+        repo.max_retries = 2
+        with pytest.raises(RepositoryError):
+            repo.search_papers("climate")
+        assert len(exhausted.requests) == 3, f"Expected max_retries + 1 attempts, got {len(exhausted.requests)}"
+
+        not_found = replying(404, 200)
+        repo = ArxivRepository(session=not_found)
+        repo.min_request_interval = 0
+        with pytest.raises(RepositoryError):
+            repo.get_paper_metadata("2301.00001")
+        assert len(not_found.requests) == 1, f"404 should not be retried, got {len(not_found.requests)} attempts"
+
+    def test_arxiv_rate_limit_is_shared_across_threads(self, fake_session, fake_response):
+        """Test that concurrent searches from separate instances stay spaced apart."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+
+        feed = Path(Path(__file__).parent, "resources", "arxiv_feed.xml").read_bytes()
+        stamps = []
+        lock = threading.Lock()
+
+        def respond(**kwargs):
+            with lock:
+                stamps.append(time.monotonic())
+            return fake_response(feed)
+
+        interval = 0.1
+        repos = [ArxivRepository(session=fake_session(respond)) for _ in range(3)]
+        for repo in repos:
+            repo.min_request_interval = interval
+        errors = []
+
+        def search(repo: ArxivRepository) -> None:
+            try:
+                repo.search_papers("climate", limit=1)
+            except RepositoryError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=search, args=(repo,)) for repo in repos]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, f"Concurrent searches should not fail, got {errors}"
+        gaps = [b - a for a, b in zip(sorted(stamps), sorted(stamps)[1:])]
+        assert len(stamps) == 3 and min(gaps) >= interval * 0.9, f"Requests should be {interval}s apart, got gaps {gaps}"
+
     @pytest.mark.live_api
     @pytest.mark.network
+    @pytest.mark.vcr
     @pytest.mark.arxiv
     def test_arxiv_search_papers(self):
         """Test searching papers in arXiv with live API."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
         repo = ArxivRepository()
         
         # Use a simple query that should return results
@@ -151,9 +493,12 @@ class TestArxivRepository:
 
     @pytest.mark.live_api
     @pytest.mark.network
+    @pytest.mark.vcr
     @pytest.mark.arxiv
     def test_arxiv_get_paper_metadata(self):
         """Test getting paper metadata from arXiv with live API."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
         repo = ArxivRepository()
         
         # First search for a real paper to get a valid arXiv ID
@@ -185,9 +530,12 @@ class TestArxivRepository:
 
     @pytest.mark.live_api
     @pytest.mark.network
+    @pytest.mark.vcr
     @pytest.mark.arxiv
-    def test_arxiv_download_paper(self, temp_dir: Path):
+    def test_arxiv_download_paper(self, tmp_path: Path):
         """Test downloading a paper from arXiv with live API."""
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
         repo = ArxivRepository()
         
         # First search for a real paper to get a valid arXiv ID
@@ -205,10 +553,10 @@ class TestArxivRepository:
         arxiv_id = search_results[0].get("arxiv_id")
         assert arxiv_id, "No valid arXiv ID found in search results"
         
-        # Test downloading the real paper to corpora directory
+        # Test downloading the real paper to a temporary directory
         result = repo.download_paper(
             paper_id=arxiv_id,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             formats=["pdf"]
         )
         
@@ -218,8 +566,8 @@ class TestArxivRepository:
         
         # Verify files were actually downloaded
         for file_path in result["files"]:
-            assert Path(file_path).exists(), f"Downloaded file {file_path} should exist"
-            assert Path(file_path).stat().st_size > 0, f"Downloaded file {file_path} should not be empty"
+            # stat() raises for a missing file, so one call checks both
+            assert Path(file_path).stat().st_size > 0, f"Downloaded file {file_path} should exist and not be empty"
 
 
 class TestRepositoryFactory:
@@ -227,6 +575,8 @@ class TestRepositoryFactory:
 
     def test_get_repository_by_name(self):
         """Test getting repository by name."""
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        from semantic_corpus.repositories.arxiv import ArxivRepository
         from semantic_corpus.core.repository_factory import RepositoryFactory
         
         # Test getting Europe PMC repository
@@ -237,6 +587,52 @@ class TestRepositoryFactory:
         repo = RepositoryFactory.get_repository("arxiv")
         assert isinstance(repo, ArxivRepository), f"Expected ArxivRepository instance, got {type(repo)}"
 
+    def test_factory_returns_same_instance(self, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest):
+        """Test that repeated lookups share one instance until a repository is registered."""
+        from semantic_corpus.core.repository_factory import RepositoryFactory
+        
+        first = RepositoryFactory.get_repository("arxiv")
+        assert RepositoryFactory.get_repository("arxiv") is first, "Repeated lookups should return the cached instance"
+        assert RepositoryFactory.get_repository("europe_pmc") is not first, "Each name should have its own instance"
+        
+        # Put the registry entry back afterwards and drop the instances cached meanwhile
+        monkeypatch.setitem(RepositoryFactory._repositories, "arxiv", RepositoryFactory._repositories["arxiv"])
+        request.addfinalizer(RepositoryFactory.get_repository.cache_clear)
+        RepositoryFactory.register_repository("arxiv", type(first))
+        assert RepositoryFactory.get_repository("arxiv") is not first, "Registering should drop cached instances"
+
+    def test_factory_lazy_import(self):
+        """Test that the factory imports only the repository module that is asked for."""
+
+        # A fresh interpreter, since this test process has imported both already
+        script = (
+            "import sys\n"
+            "from semantic_corpus.core.repository_factory import RepositoryFactory\n"
+            "assert 'semantic_corpus.repositories.europe_pmc' not in sys.modules\n"
+            "RepositoryFactory.get_repository('europe_pmc')\n"
+            "assert 'semantic_corpus.repositories.europe_pmc' in sys.modules\n"
+            "assert 'semantic_corpus.repositories.arxiv' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        assert result.returncode == 0, f"Lazy import check failed: {result.stderr}"
+
+    @pytest.mark.parametrize("repository_name", ["europe_pmc", "arxiv"])
+    def test_get_repository_info_returns_copies(self, repository_name: str):
+        """Test that each call returns its own plain, serializable dict."""
+        from semantic_corpus.core.repository_factory import RepositoryFactory
+        
+        repo = RepositoryFactory.get_repository(repository_name)
+        info = repo.get_repository_info()
+        assert isinstance(info, dict), f"Expected a dict, got {type(info)}"
+        assert info["name"] == repo.name, f"Expected name '{repo.name}', got '{info['name']}'"
+        json.dumps(info)
+        
+        info["name"] = "changed"
+        info["supported_formats"].append("changed")
+        again = repo.get_repository_info()
+        assert again["name"] == repo.name, "Changing a returned dict should not affect later calls"
+        assert "changed" not in again["supported_formats"], f"Formats should be copied, got {again['supported_formats']}"
+
     def test_get_repository_raises_error_for_unknown(self):
         """Test that getting unknown repository raises error."""
         from semantic_corpus.core.repository_factory import RepositoryFactory
@@ -244,6 +640,60 @@ class TestRepositoryFactory:
         with pytest.raises(RepositoryError):
             RepositoryFactory.get_repository("unknown_repository")
 
+    def test_repositories_share_http_session(self):
+        """Test that repositories reuse one connection pool unless given their own."""
+        import requests
+        from semantic_corpus.repositories.europe_pmc import EuropePMCRepository
+        from semantic_corpus.repositories.arxiv import ArxivRepository
+        
+        europe_pmc = EuropePMCRepository()
+        arxiv = ArxivRepository()
+        assert europe_pmc.session is arxiv.session, "Repositories should share the default HTTP session"
+
+        own_session = requests.Session()
+        try:
+            repo = EuropePMCRepository(session=own_session)
+            assert repo.session is own_session, "An injected session should be used as given"
+        finally:
+            own_session.close()
+
+    def test_http_pool_reuse(self):
+        """Test that sequential requests reuse one keep-alive connection."""
+        from semantic_corpus.core.http import create_session
+
+        client_ports = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                client_ports.append(self.client_address[1])
+                body = b"ok"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = create_session()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            for _ in range(10):
+                response = session.get(url)
+                response.raise_for_status()
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+        assert len(client_ports) == 10, f"Expected 10 requests, got {len(client_ports)}"
+        assert len(set(client_ports)) == 1, f"Expected one reused connection, got {len(set(client_ports))}"
+
     def test_list_available_repositories(self):
         """Test listing available repositories."""
         from semantic_corpus.core.repository_factory import RepositoryFactory
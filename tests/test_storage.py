@@ -1,5 +1,7 @@
 """Tests for storage management functionality."""
 
+import hashlib
+import os
 import pytest
 from pathlib import Path
 from semantic_corpus.storage.bagit_manager import BagitManager
@@ -9,31 +11,31 @@ from semantic_corpus.core.exceptions import CorpusError
 class TestBagitManager:
     """Test cases for BagitManager class."""
 
-    def test_bagit_manager_initialization(self, temp_dir: Path):
+    def test_bagit_manager_initialization(self, tmp_path: Path):
         """Test that BagitManager can be initialized with a directory."""
-        bagit_manager = BagitManager(temp_dir)
-        assert bagit_manager.bag_dir == temp_dir, f"Expected bag_dir to be {temp_dir}, got {bagit_manager.bag_dir}"
+        bagit_manager = BagitManager(tmp_path)
+        assert bagit_manager.bag_dir == tmp_path, f"Expected bag_dir to be {tmp_path}, got {bagit_manager.bag_dir}"
 
-    def test_create_bag_structure(self, temp_dir: Path):
+    def test_create_bag_structure(self, tmp_path: Path):
         """Test creating a BAGIT-compliant bag structure."""
-        bagit_manager = BagitManager(temp_dir)
+        bagit_manager = BagitManager(tmp_path)
         bagit_manager.create_bag()
         
         # Check BAGIT required files
-        assert Path(temp_dir, "bagit.txt").exists(), "bagit.txt should exist"
-        assert Path(temp_dir, "bag-info.txt").exists(), "bag-info.txt should exist"
+        assert Path(tmp_path, "bagit.txt").exists(), "bagit.txt should exist"
+        assert Path(tmp_path, "bag-info.txt").exists(), "bag-info.txt should exist"
         # bagit library creates SHA256/SHA512 manifests by default, not MD5
         # Check that at least one manifest file exists
         manifest_files = [
-            Path(temp_dir, "manifest-md5.txt"),
-            Path(temp_dir, "manifest-sha256.txt"),
-            Path(temp_dir, "manifest-sha512.txt"),
+            Path(tmp_path, "manifest-md5.txt"),
+            Path(tmp_path, "manifest-sha256.txt"),
+            Path(tmp_path, "manifest-sha512.txt"),
         ]
         assert any(mf.exists() for mf in manifest_files), "No manifest file found"
-        assert Path(temp_dir, "data").exists(), "data directory should exist"
-        assert Path(temp_dir, "data").is_dir(), "data should be a directory"
+        assert Path(tmp_path, "data").exists(), "data directory should exist"
+        assert Path(tmp_path, "data").is_dir(), "data should be a directory"
 
-    def test_create_bag_with_metadata(self, temp_dir: Path):
+    def test_create_bag_with_metadata(self, tmp_path: Path):
         """Test creating a bag with custom metadata."""
         metadata = {
             "Source-Organization": "Test Organization",
@@ -41,31 +43,53 @@ class TestBagitManager:
             "Contact-Name": "Test User",
             "Contact-Email": "test@example.com",
         }
-        bagit_manager = BagitManager(temp_dir)
+        bagit_manager = BagitManager(tmp_path)
         bagit_manager.create_bag(metadata=metadata)
         
         # Check bag-info.txt contains metadata
-        bag_info = Path(temp_dir, "bag-info.txt")
+        bag_info = Path(tmp_path, "bag-info.txt")
         assert bag_info.exists(), "bag-info.txt should exist"
         content = bag_info.read_text()
         assert "Source-Organization: Test Organization" in content, "bag-info.txt should contain 'Source-Organization: Test Organization'"
 
-    def test_validate_bag(self, temp_dir: Path):
+    def test_validate_bag(self, temp_bag: Path):
         """Test validating an existing bag."""
-        bagit_manager = BagitManager(temp_dir)
-        bagit_manager.create_bag()
+        bagit_manager = BagitManager(temp_bag)
         
         # Validation should pass for a valid bag
         is_valid = bagit_manager.validate_bag()
         assert is_valid is True, "Valid bag should return True"
 
-    def test_add_file_to_bag(self, temp_dir: Path):
-        """Test adding a file to the bag data directory."""
-        bagit_manager = BagitManager(temp_dir)
+    def test_validate_bag_parallel(self, temp_bag: Path):
+        """Test validating a bag with a process pool, including a corrupted file."""
+        bagit_manager = BagitManager(temp_bag)
+        for i in range(50):
+            Path(temp_bag, "data", f"file_{i:02d}.txt").write_text(f"content {i}")
+        bagit_manager.update_manifest()
+        
+        assert bagit_manager.validate_bag(processes=2) is True, "Bag should be valid when checked by two processes"
+        assert bagit_manager.validate_bag() is True, "Small bag should be valid with the default process count"
+        
+        Path(temp_bag, "data", "file_07.txt").write_text("content X")
+        assert bagit_manager.validate_bag(processes=2) is False, "A changed file should fail parallel validation"
+
+    def test_bag_uses_sha256_only(self, tmp_path: Path):
+        """Test that new bags carry a single SHA-256 payload and tag manifest."""
+        bagit_manager = BagitManager(tmp_path)
         bagit_manager.create_bag()
+        Path(tmp_path, "data", "test.txt").write_text("test content")
+        bagit_manager.update_manifest()
+        
+        manifests = sorted(path.name for path in tmp_path.glob("*manifest-*.txt"))
+        assert manifests == ["manifest-sha256.txt", "tagmanifest-sha256.txt"], f"Expected only SHA-256 manifests, got {manifests}"
+        assert bagit_manager.validate_bag() is True, "SHA-256 only bag should be valid"
+
+    def test_add_file_to_bag(self, temp_bag: Path):
+        """Test adding a file to the bag data directory."""
+        bagit_manager = BagitManager(temp_bag)
         
         # Create a test file
-        test_file = Path(temp_dir, "data", "test.txt")
+        test_file = Path(temp_bag, "data", "test.txt")
         test_file.write_text("test content")
         
         # Update manifest
@@ -73,22 +97,115 @@ class TestBagitManager:
         
         # Check manifest includes the file (check any manifest file that exists)
         manifest_files = [
-            Path(temp_dir, "manifest-md5.txt"),
-            Path(temp_dir, "manifest-sha256.txt"),
-            Path(temp_dir, "manifest-sha512.txt"),
+            Path(temp_bag, "manifest-md5.txt"),
+            Path(temp_bag, "manifest-sha256.txt"),
+            Path(temp_bag, "manifest-sha512.txt"),
         ]
         manifest = next((mf for mf in manifest_files if mf.exists()), None)
         assert manifest is not None, "No manifest file found after update"
         content = manifest.read_text()
         assert "data/test.txt" in content, "Manifest should contain 'data/test.txt'"
 
-    def test_get_bag_info(self, temp_dir: Path):
+    def test_update_manifest_rehashes_only_changed_files(self, temp_bag: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that update_manifest reuses digests of files that have not changed."""
+        from semantic_corpus.storage import bagit_manager as bagit_module
+        
+        bagit_manager = BagitManager(temp_bag)
+        test_file = Path(temp_bag, "data", "test.txt")
+        test_file.write_text("test content")
+        # Modified well before the update, so it cannot share its timestamp tick
+        os.utime(test_file, (1_000_000_000, 1_000_000_000))
+        bagit_manager.update_manifest()
+        
+        hashed = []
+        file_digests = bagit_module._file_digests
+        def counting_file_digests(path, algorithms):
+            hashed.append(Path(path).relative_to(temp_bag).as_posix())
+            return file_digests(path, algorithms)
+        monkeypatch.setattr(bagit_module, "_file_digests", counting_file_digests)
+        
+        Path(temp_bag, "data", "new.txt").write_text("new content")
+        bagit_manager.update_manifest()
+        
+        payload_hashed = [path for path in hashed if path.startswith("data/")]
+        assert payload_hashed == ["data/new.txt"], f"Only the new file should be hashed, got {payload_hashed}"
+        manifest = Path(temp_bag, "manifest-sha256.txt").read_text()
+        assert "data/test.txt" in manifest and "data/new.txt" in manifest, f"Manifest should list both files, got:\n{manifest}"
+        assert bagit_manager.validate_bag() is True, "Bag should be valid after an incremental update"
+
+    def test_update_manifest_rehashes_same_size_rewrite(self, temp_bag: Path):
+        """Test that a same-size rewrite within the cache's timestamp tick is re-hashed."""
+        bagit_manager = BagitManager(temp_bag)
+        test_file = Path(temp_bag, "data", "test.txt")
+        # On a filesystem with coarse timestamps the file, the update and the
+        # rewrite can all fall in one tick, so size and mtime look unchanged
+        tick_ns = 1_000_000_000 * 10**9
+        test_file.write_text("test content")
+        os.utime(test_file, ns=(tick_ns, tick_ns))
+        bagit_manager.update_manifest()
+        os.utime(Path(temp_bag, ".manifest-cache.json"), ns=(tick_ns, tick_ns))
+        
+        test_file.write_text("TEST CONTENT")
+        os.utime(test_file, ns=(tick_ns, tick_ns))
+        bagit_manager.update_manifest()
+        
+        assert bagit_manager.validate_bag() is True, "The rewritten file should have been re-hashed"
+        tagmanifest = Path(temp_bag, "tagmanifest-sha256.txt").read_text()
+        assert ".manifest-cache.json" not in tagmanifest, f"The cache should not be a tag file, got:\n{tagmanifest}"
+
+    def test_update_manifest_replaces_files_atomically(self, temp_bag: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that a failed manifest write leaves the previous manifest intact."""
+        from semantic_corpus.storage import bagit_manager as bagit_module
+        
+        bagit_manager = BagitManager(temp_bag)
+        Path(temp_bag, "data", "test.txt").write_text("test content")
+        bagit_manager.update_manifest()
+        before = Path(temp_bag, "manifest-sha256.txt").read_bytes()
+        
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(bagit_module.os, "replace", failing_replace)
+        Path(temp_bag, "data", "new.txt").write_text("new content")
+        with pytest.raises(OSError):
+            bagit_manager.update_manifest()
+        
+        assert Path(temp_bag, "manifest-sha256.txt").read_bytes() == before, "The old manifest should survive a failed update"
+        leftovers = [path.name for path in temp_bag.iterdir() if path.name.endswith(".tmp")]
+        assert not leftovers, f"Temporary files should be cleaned up, found {leftovers}"
+        
+        monkeypatch.undo()
+        bagit_manager.update_manifest()
+        assert "data/new.txt" in Path(temp_bag, "manifest-sha256.txt").read_text(), "A later update should succeed"
+        assert bagit_manager.validate_bag() is True, "Bag should be valid after recovering"
+
+    def test_update_manifest_records_file_digests(self, temp_bag: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that manifests hold each payload file's digest, with and without hashlib.file_digest."""
+        bagit_manager = BagitManager(temp_bag)
+        content = b"x" * (3 * 1024 * 1024 + 7)
+        Path(temp_bag, "data", "large.bin").write_bytes(content)
+        expected = hashlib.sha256(content).hexdigest()
+        
+        bagit_manager.update_manifest()
+        manifest = Path(temp_bag, "manifest-sha256.txt").read_text()
+        assert f"{expected}  data/large.bin" in manifest, f"Manifest should record the sha256 of data/large.bin, got:\n{manifest}"
+        assert bagit_manager.validate_bag() is True, "Bag should be valid after update_manifest"
+        
+        # Python < 3.11 has no hashlib.file_digest; the chunked fallback must agree
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        Path(temp_bag, "data", "large.bin").write_bytes(content[::-1])
+        bagit_manager.update_manifest()
+        manifest = Path(temp_bag, "manifest-sha256.txt").read_text()
+        expected = hashlib.sha256(content[::-1]).hexdigest()
+        assert f"{expected}  data/large.bin" in manifest, f"Fallback hashing should record the same digest, got:\n{manifest}"
+        assert bagit_manager.validate_bag() is True, "Bag should be valid after fallback update_manifest"
+
+    def test_get_bag_info(self, tmp_path: Path):
         """Test retrieving bag information."""
         metadata = {
             "Source-Organization": "Test Org",
             "Bag-Size": "1 MB",
         }
-        bagit_manager = BagitManager(temp_dir)
+        bagit_manager = BagitManager(tmp_path)
         bagit_manager.create_bag(metadata=metadata)
         
         bag_info = bagit_manager.get_bag_info()
@@ -97,31 +214,49 @@ class TestBagitManager:
         assert bag_info["Source-Organization"] == "Test Org", f"Expected 'Source-Organization' to be 'Test Org', got '{bag_info.get('Source-Organization')}'"
         assert "Bag-Size" in bag_info, "bag_info should contain 'Bag-Size'"
 
-    def test_create_structured_directories(self, temp_dir: Path):
+    def test_get_bag_info_does_not_open_bag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that bag info is read straight from bag-info.txt, including folded and repeated tags."""
+        import bagit
+        
+        bagit_manager = BagitManager(tmp_path)
+        bagit_manager.create_bag(metadata={"Source-Organization": "Test Org"})
+        with open(Path(tmp_path, "bag-info.txt"), "a", encoding="utf-8") as f:
+            f.write("Contact-Name: Ada\nContact-Name: Alan\nExternal-Description: first line\n  continued\n")
+        
+        def no_bag(*args, **kwargs):
+            raise AssertionError("get_bag_info should not open a bagit.Bag")
+        monkeypatch.setattr(bagit, "Bag", no_bag)
+        
+        bag_info = bagit_manager.get_bag_info()
+        assert bag_info["Source-Organization"] == "Test Org", f"Unexpected Source-Organization {bag_info.get('Source-Organization')!r}"
+        assert bag_info["Contact-Name"] == ["Ada", "Alan"], f"Repeated tags should be collected, got {bag_info.get('Contact-Name')!r}"
+        assert bag_info["External-Description"] == "first line  continued", f"Folded value not joined, got {bag_info.get('External-Description')!r}"
+        assert BagitManager(Path(tmp_path, "data")).get_bag_info() == {}, "A directory without bagit.txt should give no info"
+
+    def test_create_structured_directories(self, temp_bag: Path):
         """Test creating structured corpus directories."""
-        bagit_manager = BagitManager(temp_dir)
-        bagit_manager.create_bag()
+        bagit_manager = BagitManager(temp_bag)
         bagit_manager.create_structured_directories()
         
         # Check all required directories exist
-        assert Path(temp_dir, "data", "documents").exists(), "data/documents directory should exist"
-        assert Path(temp_dir, "data", "documents", "pdf").exists(), "data/documents/pdf directory should exist"
-        assert Path(temp_dir, "data", "documents", "xml").exists(), "data/documents/xml directory should exist"
-        assert Path(temp_dir, "data", "documents", "html").exists(), "data/documents/html directory should exist"
-        assert Path(temp_dir, "data", "semantic").exists(), "data/semantic directory should exist"
-        assert Path(temp_dir, "data", "metadata").exists(), "data/metadata directory should exist"
-        assert Path(temp_dir, "data", "keyphrases").exists(), "data/keyphrases directory should exist"
-        assert Path(temp_dir, "data", "indices").exists(), "data/indices directory should exist"
-        assert Path(temp_dir, "relations").exists(), "relations directory should exist"
-        assert Path(temp_dir, "analysis").exists(), "analysis directory should exist"
-        assert Path(temp_dir, "provenance").exists(), "provenance directory should exist"
-
-    def test_validate_invalid_bag(self, temp_dir: Path):
+        assert Path(temp_bag, "data", "documents").exists(), "data/documents directory should exist"
+        assert Path(temp_bag, "data", "documents", "pdf").exists(), "data/documents/pdf directory should exist"
+        assert Path(temp_bag, "data", "documents", "xml").exists(), "data/documents/xml directory should exist"
+        assert Path(temp_bag, "data", "documents", "html").exists(), "data/documents/html directory should exist"
+        assert Path(temp_bag, "data", "semantic").exists(), "data/semantic directory should exist"
+        assert Path(temp_bag, "data", "metadata").exists(), "data/metadata directory should exist"
+        assert Path(temp_bag, "data", "keyphrases").exists(), "data/keyphrases directory should exist"
+        assert Path(temp_bag, "data", "indices").exists(), "data/indices directory should exist"
+        assert Path(temp_bag, "relations").exists(), "relations directory should exist"
+        assert Path(temp_bag, "analysis").exists(), "analysis directory should exist"
+        assert Path(temp_bag, "provenance").exists(), "provenance directory should exist"
+
+    def test_validate_invalid_bag(self, tmp_path: Path):
         """Test validating an invalid bag (missing required files)."""
         # Create directory but not a valid bag
-        Path(temp_dir, "data").mkdir()
+        Path(tmp_path, "data").mkdir()
         
-        bagit_manager = BagitManager(temp_dir)
+        bagit_manager = BagitManager(tmp_path)
         
         # Validation should fail
         is_valid = bagit_manager.validate_bag()